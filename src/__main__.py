@@ -0,0 +1,12 @@
+"""Command line interface: `python -m Warp` (see `Warp.cli`).
+
+Keypirinha imports every module at the root of the package, so nothing runs
+unless the module is executed.
+"""
+
+if __name__ == "__main__":
+    import sys
+
+    from Warp import cli
+
+    sys.exit(cli.main())
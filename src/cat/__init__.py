@@ -0,0 +1,139 @@
+"""Warp categories.
+
+Every category is a module of this package with the same interface:
+
+    `CATEGORY`
+        Keypirinha item category of the module's main entries.
+    `KEYWORDS`
+        LaTeX-like keywords (commands) handled by the module.
+    `assign_cat(plugin)`
+        Returns a list of the module's main entries.
+    `get_suggestions(plugin, user_input, prev_target)`
+        Returns a list of suggestions for `user_input`. `prev_target` is the
+        target of the main entry selected by the user.
+    `render(prev_target, user_input)` (optional)
+        Returns the output of a deferred suggestion (see `deferred`).
+    `TAGS` (optional)
+        Extra search words of the main entries (a dictionary of lists by
+        labels, see `engine.search`).
+
+Suggestions' data bags are ASCII-only (see `deferred` and `exact`), so the
+output copied on execution is exact even for characters beyond `U+FFFF`.
+Suggestions of a ready output are created by `output_item`.
+
+Category modules are adapters between Keypirinha and `Warp.engine`: the
+tables and the conversions are in the engine module of the same name.
+
+To add a new category, create a module with this interface and append its
+name to `MODULES`.
+
+Category modules hold large mapping tables, so they are imported on first use
+rather than together with the plugin.
+"""
+
+import importlib
+import json
+
+import keypirinha as kp
+
+MODULES = [
+    "base",
+    "symbols",
+    "operations",
+    "diacritical",
+    "fonts",
+    "roman",
+    "matrix",
+    "table",
+    "dirtree",
+    "expression",
+    "unwarp"]
+
+_modules = {}
+_registry = {}
+
+def load(name):
+    """Imports the category module `name` (once) and registers it."""
+
+    module = _modules.get(name)
+    if module is None:
+        module = importlib.import_module(f"{__name__}.{name}")
+        _modules[name] = module
+        _registry[module.CATEGORY] = module
+    return module
+
+def modules():
+    """Returns all category modules (in order of `MODULES`)."""
+
+    return [load(name) for name in MODULES]
+
+def deferred(module_name, prev_target, user_input):
+    """Returns a data bag of a suggestion rendered on execution.
+
+    Generated layouts (matrices, tables, ...) may be huge, so their
+    suggestions hold only this descriptor and a short preview, and the
+    output is rendered by the module's `render` when the suggestion is
+    executed.
+    """
+
+    name = module_name.rsplit(".", 1)[-1]
+    return json.dumps([name, prev_target, user_input])
+
+def exact(output):
+    """Returns a data bag of a suggestion with a ready `output`.
+
+    Keypirinha splits characters beyond `U+FFFF` (e.g. `U+1D49C`) of items'
+    targets into two, so such outputs are copied from the data bag, where
+    they are escaped to ASCII. Other outputs are exact as targets, and their
+    data bag is empty.
+    """
+
+    if not output or max(output) <= "\uffff":
+        return ""
+    return json.dumps([None, output])
+
+def padded(text):
+    """Returns `text` of a display field (`short_desc`) of a font.
+
+    Keypirinha splits characters beyond `U+FFFF` in display fields as in
+    targets, so they are repeated after `text` (a "mirror", e.g. `𝔸1` →
+    `𝔸1𝔸`) for the display to show them. Outputs are copied from data bags
+    (see `deferred`), which are never padded.
+    """
+
+    return text + "".join(char for char in text if char > "\uffff")
+
+def output_item(plugin, label, output, short_desc=None):
+    """Returns a suggestion copying a ready `output` (`short_desc` defaults
+    to `output`).
+
+    Its data bag is `exact(output)`, so category modules create their
+    output suggestions here rather than with `plugin.create_item`.
+    """
+
+    return plugin.create_item(
+        category=load("symbols").CATEGORY,
+        label=label,
+        short_desc=output if short_desc is None else short_desc,
+        target=output,
+        args_hint=kp.ItemArgsHint.FORBIDDEN,
+        hit_hint=kp.ItemHitHint.IGNORE,
+        data_bag=exact(output))
+
+def render(data_bag):
+    """Returns the output of a suggestion (see `deferred` and `exact`)."""
+
+    name, *args = json.loads(data_bag)
+    if name is None:
+        return args[0]
+    return load(name).render(*args)
+
+def get(category):
+    """Returns the module registered for `category` (or `None`)."""
+
+    module = _registry.get(category)
+    if module is None and len(_modules) < len(MODULES):
+        # `category` may belong to a module that is not loaded yet
+        modules()
+        module = _registry.get(category)
+    return module
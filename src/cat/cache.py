@@ -0,0 +1,54 @@
+"""Cache of suggestions.
+
+Suggestions are pure functions of `(category, prev_target, user_input)`, so
+they can be remembered when the user erases and retypes some characters or
+reopens the same command (e.g. `\\matrix` → `3,3`).
+"""
+
+import collections
+import threading
+
+class LRUCache:
+    """Thread-safe least recently used cache with hit and miss counters.
+
+    `size` is the maximal number of entries (`0` disables the cache).
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Returns the value of `key` (or `None`)."""
+
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """Stores `value` for `key`, evicting the least recently used entry."""
+
+        with self._lock:
+            if self.size > 0:
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.size:
+                    self._entries.popitem(last=False)
+
+    def clear(self, size=None):
+        """Removes all entries (and resizes the cache if `size` is given)."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            if size is not None:
+                self.size = size
@@ -0,0 +1,45 @@
+"""Inline LaTeX-like expressions.
+
+Converts a whole expression at once: symbols, superscripts and subscripts,
+fractions, math fonts and diacritical symbols (accents).
+Commands that can't be converted are left unchanged.
+
+    Typical usage
+
+    Warp:
+    `\\expr` → `\\alpha_i^2 \\in \\mathbb{R}, \\frac{1}{2} \\hat{x}`
+    Output:
+    `αᵢ² ∈ ℝ, ½ x̂`
+"""
+
+import keypirinha as kp
+
+from Warp import cat
+from Warp.engine import expression
+
+CATEGORY = kp.ItemCategory.USER_BASE + 10
+
+KEYWORDS = expression.KEYWORDS
+
+TAGS = expression.TAGS
+
+def assign_cat(plugin):
+    """Assigns `expression` module keyword to the `Warp` plugin."""
+
+    items = [plugin.create_item(
+        category=CATEGORY,
+        label=expression.KEYWORD_EXPRESSION,
+        short_desc="Expression: αᵢ² ∈ ℝ",
+        target=expression.KEYWORD_EXPRESSION,
+        args_hint=kp.ItemArgsHint.REQUIRED,
+        hit_hint=kp.ItemHitHint.IGNORE)]
+    return items
+
+def get_suggestions(plugin, user_input, prev_target):
+    """Returns the result of this plugin."""
+
+    items = []
+    if len(user_input) > 0:
+        output = expression.construct_output(user_input)
+        items.append(cat.output_item(plugin, user_input, output))
+    return items
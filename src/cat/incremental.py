@@ -0,0 +1,81 @@
+"""Incremental conversion of `user_input`.
+
+Keypirinha calls `on_suggest` on every keystroke with the whole `user_input`,
+so typing a long string converts its beginning over and over again.
+`Converter` remembers the previous conversion and, when the new input shares
+a prefix with the previous one (a character was typed or erased at the end),
+converts only the rest of it.
+"""
+
+import bisect
+import threading
+
+class Converter:
+    """Incremental converter.
+
+    `tokenize(key, user_input, start)` must yield `(end, piece)` pairs, where
+    `piece` is the output for `user_input` from the end of the previous pair
+    (or `start`) up to `end`. Scanning must be restartable at any `end`.
+
+    A token may depend on up to `lookbehind` characters after its start
+    (e.g. the longest command is `lookbehind + 1` characters long), so tokens
+    that are too close to the end of the common prefix are converted again.
+    `key` identifies the conversion (e.g. `prev_target`); a different key
+    means a full conversion.
+    """
+
+    CHUNK_SIZE = 1024 # tokens converted between cancellation checks
+
+    def __init__(self, tokenize, lookbehind=0):
+        self._tokenize = tokenize
+        self._lookbehind = lookbehind
+        self._lock = threading.Lock()
+        self._key = None
+        self._input = ""
+        self._output = ""
+        self._ends = [] # input positions of the tokens' ends
+        self._lengths = [] # output lengths at the tokens' ends
+
+    def convert(self, key, user_input, should_terminate=None):
+        """Converts `user_input`, reusing the previous conversion if possible.
+
+        `should_terminate` (e.g. `Plugin.should_terminate`) is called after
+        every `CHUNK_SIZE` tokens. If it returns `True`, the conversion is
+        aborted and `None` is returned; the already converted part is kept
+        and reused by the next call.
+        """
+
+        with self._lock:
+            common = 0
+            if key == self._key:
+                if user_input.startswith(self._input):
+                    common = len(self._input)
+                elif self._input.startswith(user_input):
+                    common = len(user_input)
+
+            # Last token that can't be changed by the new characters
+            idx = bisect.bisect_right(self._ends, common - self._lookbehind)
+            del self._ends[idx:]
+            del self._lengths[idx:]
+            start = self._ends[-1] if idx > 0 else 0
+            length = self._lengths[-1] if idx > 0 else 0
+
+            aborted = False
+            pieces = [self._output[:length]]
+            for end, piece in self._tokenize(key, user_input, start):
+                pieces.append(piece)
+                length += len(piece)
+                self._ends.append(end)
+                self._lengths.append(length)
+                if (should_terminate
+                        and len(pieces) % self.CHUNK_SIZE == 0
+                        and should_terminate()):
+                    # Newer input supersedes this one
+                    aborted = True
+                    user_input = user_input[:end]
+                    break
+
+            self._key = key
+            self._input = user_input
+            self._output = "".join(pieces)
+            return None if aborted else self._output
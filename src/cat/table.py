@@ -21,81 +21,53 @@ to `10` and you can specify only `m` and `n`. Values must be separated by commas
 
 import keypirinha as kp
 
-KEYWORD_TABLE = "\\table" # Markdown-style
+from Warp import cat
+from Warp.cat import symbols
+from Warp.engine import table
+
+CATEGORY = kp.ItemCategory.USER_BASE + 8
+
+KEYWORDS = table.KEYWORDS
 
 def assign_cat(plugin):
     """Assigns `table` module keywords to the `Warp` plugin."""
 
-    item = plugin.create_item(
-        category=plugin.CATEGORY_TABLE,
-        label=KEYWORD_TABLE,
+    items = [plugin.create_item(
+        category=CATEGORY,
+        label=table.KEYWORD_TABLE,
         short_desc="Table",
-        target=KEYWORD_TABLE,
+        target=table.KEYWORD_TABLE,
         args_hint=kp.ItemArgsHint.REQUIRED,
-        hit_hint=kp.ItemHitHint.IGNORE)
-    return item
-
-def _construct_output(user_input):
-    """Converts `user_input` string to output string and returns some meta."""
+        hit_hint=kp.ItemHitHint.IGNORE)]
+    return items
 
-    output = ""
-    short_desc = ""
-    error_indicator = False
+def render(prev_target, user_input):
+    """Returns the output of a deferred suggestion."""
 
-    attrs = user_input.split(',')
+    output, short_desc, error_indicator = table.construct_output(user_input)
+    return output
 
-    if not len(attrs) in [2, 3]:
-        error_indicator = True
-        output = (
-            f"Number of attributes must be 2 or 3. "
-            f"Wrong value: {user_input}")
-    if not error_indicator and False in [a.isdigit() for a in attrs]:
-        error_indicator = True
-        output = (
-            f"All attributes must be a positive integer. "
-            f"Wrong value: {user_input}")
-    if not error_indicator and True in [int(a) < 1 for a in attrs]:
-        error_indicator = True
-        output = (
-            f"All attributes must be ≥ 1. "
-            f"Wrong value: {user_input}")
-
-    if not error_indicator:
-        nrows = 1
-        ncols = 3
-        width = 10
-
-        if len(attrs) == 2:
-            nrows = int(attrs[0])
-            ncols = int(attrs[1])
-        elif len(attrs) == 3:
-            nrows = int(attrs[0])
-            ncols = int(attrs[1])
-            width = int(attrs[2])
-        output = ((
-            "| " + " " * width + " ") * ncols + "|\n" + (
-            "| " + "-" * width + " ") * ncols + "|\n" + ((
-            "| " + " " * width + " ") * ncols + "|\n") * nrows)
-        short_desc = f"table [rows: {nrows}, cols: {ncols}, width: {width}]"
-    
-    return output, short_desc, error_indicator
+def get_suggestions(plugin, user_input, prev_target):
+    """Returns the result of this plugin.
 
-def get_suggestions(plugin, user_input):
-    """Returns the result of this plugin."""
+    The table itself is rendered on execution (see `render`).
+    """
     
-    item = None
+    items = []
     if len(user_input) > 0:
-        output, short_desc, error_indicator = _construct_output(user_input)
+        output, short_desc, error_indicator = table.construct_output(
+            user_input, rendering=False, limits=plugin.limits)
         if error_indicator:
-            item = plugin.create_error_item(
+            items.append(plugin.create_error_item(
                 label=output,
-                short_desc="Error")
+                short_desc="Error"))
         else:
-            item = plugin.create_item(
-                category=plugin.CATEGORY_SYMBOLS,
+            items.append(plugin.create_item(
+                category=symbols.CATEGORY,
                 label=user_input,
                 short_desc=short_desc,
-                target=output,
+                target=f"{prev_target} {user_input}",
                 args_hint=kp.ItemArgsHint.FORBIDDEN,
-                hit_hint=kp.ItemHitHint.IGNORE)
-    return item
\ No newline at end of file
+                hit_hint=kp.ItemHitHint.IGNORE,
+                data_bag=cat.deferred(__name__, prev_target, user_input)))
+    return items
\ No newline at end of file
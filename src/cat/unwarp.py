@@ -0,0 +1,45 @@
+"""Unicode to LaTeX-like commands (reverse conversion).
+
+Converts Unicode text (e.g. produced by Warp) back to LaTeX-like commands:
+symbols, fractions, superscripts and subscripts, math fonts, roman numbers
+and diacritical symbols. Other characters are left unchanged.
+
+    Typical usage
+
+    Warp:
+    `\\unwarp` → `αᵢ⁽²⁾ ∈ ℝ`
+    Output:
+    `\\alpha_{i}^{(2)} \\in \\mathbb{R}`
+"""
+
+import keypirinha as kp
+
+from Warp import cat
+from Warp.engine import unwarp
+
+CATEGORY = kp.ItemCategory.USER_BASE + 11
+
+KEYWORDS = unwarp.KEYWORDS
+
+TAGS = unwarp.TAGS
+
+def assign_cat(plugin):
+    """Assigns `unwarp` module keyword to the `Warp` plugin."""
+
+    items = [plugin.create_item(
+        category=CATEGORY,
+        label=unwarp.KEYWORD_UNWARP,
+        short_desc="Unicode to LaTeX: ℝ² → \\mathbb{R}^{2}",
+        target=unwarp.KEYWORD_UNWARP,
+        args_hint=kp.ItemArgsHint.REQUIRED,
+        hit_hint=kp.ItemHitHint.IGNORE)]
+    return items
+
+def get_suggestions(plugin, user_input, prev_target):
+    """Returns the result of this plugin."""
+
+    items = []
+    if len(user_input) > 0:
+        output = unwarp.construct_output(user_input)
+        items.append(cat.output_item(plugin, user_input, output))
+    return items
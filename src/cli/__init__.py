@@ -0,0 +1,172 @@
+"""Command line interface of `Warp.engine`.
+
+    python -m Warp [--mode MODE] [--markup MARKUP] [--output FILE] [FILE]
+
+Converts a whole document (e.g. a Markdown or AsciiDoc manuscript) as a
+build step. The input (`FILE` or stdin) is read in chunks of bounded size
+(files are memory-mapped) and streamed through the engine (see `stream`),
+so memory doesn't depend on the size of the input.
+Code and math of Markdown and AsciiDoc documents (chosen by the extension
+of the file or `--markup`) are left unchanged (see `engine.markup`).
+If the input is a directory, the files of its tree are converted into the
+output directory by a pool of processes (see `batch`).
+The default mode is `expr` (symbols, scripts, fractions, fonts and accents
+of the text).
+
+    python -m Warp --serve [--socket PATH]
+
+runs a conversion server for editors (see `server`).
+
+Like `Warp.engine`, this package doesn't depend on Keypirinha.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from Warp import engine
+from Warp.cli import batch
+from Warp.cli import server
+from Warp.cli import stream
+
+DEFAULT_MODE = "expr"
+DEFAULT_GLOB = "*.md"
+
+def _parser():
+    """Returns the parser of the command line arguments."""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m Warp",
+        description="Converts LaTeX-like syntax to Unicode.")
+    parser.add_argument(
+        "input", nargs="?", metavar="FILE",
+        help=(
+            "input file (UTF-8) or directory, stdin if omitted or `-`"))
+    parser.add_argument(
+        "-m", "--mode", default=DEFAULT_MODE,
+        help=(
+            f"conversion mode: `expr`, `^`, `_` or a font keyword (e.g. "
+            f"`mathbb`), default: `{DEFAULT_MODE}`"))
+    parser.add_argument(
+        "--markup", choices=stream.MARKUPS, default=stream.AUTO,
+        help=(
+            "markup of the input, whose code and math aren't converted, "
+            "default: by extension (`.md`, `.adoc`), text for stdin"))
+    parser.add_argument(
+        "-o", "--output", metavar="FILE",
+        help=(
+            "output file, stdout if omitted "
+            "(output directory if the input is a directory)"))
+    parser.add_argument(
+        "--chunk-size", type=int, default=stream.DEFAULT_CHUNK_SIZE,
+        metavar="BYTES",
+        help=f"size of the chunks read, default: {stream.DEFAULT_CHUNK_SIZE}")
+    parser.add_argument(
+        "--stats", action="store_true",
+        help="print the size of the input and throughput to stderr")
+    group = parser.add_argument_group("directories")
+    group.add_argument(
+        "-j", "--jobs", type=int, metavar="N",
+        help="number of worker processes, default: number of CPUs")
+    group.add_argument(
+        "--glob", default=DEFAULT_GLOB, metavar="PATTERN",
+        help=f"names of the files converted, default: `{DEFAULT_GLOB}`")
+    group.add_argument(
+        "--force", action="store_true",
+        help="convert unchanged files too")
+    group = parser.add_argument_group("server")
+    group.add_argument(
+        "--serve", action="store_true",
+        help="answer JSON-lines requests on stdin/stdout (or --socket)")
+    group.add_argument(
+        "--socket", metavar="PATH",
+        help="Unix socket of the server")
+    return parser
+
+def _convert_tree(parser, args):
+    """Converts a directory (see `batch`). Returns the exit status."""
+
+    if not args.output:
+        parser.error("an output directory is required for a directory")
+    if os.path.isdir(args.output) and os.path.samefile(
+            args.input, args.output):
+        # Converted files would be the sources of the next run
+        parser.error("the input and the output are the same directory")
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be a positive integer")
+    start = time.perf_counter()
+    try:
+        summary = batch.convert_tree(
+            args.input, args.output, args.mode, args.glob, args.jobs,
+            args.force, log=lambda message: print(message, file=sys.stderr),
+            markup=args.markup)
+    except OSError as error:
+        print(f"{parser.prog}: {error}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    print(batch.report(summary, elapsed), file=sys.stderr)
+    return 1 if summary[batch.FAILED][0] else 0
+
+def _same_file(source, path):
+    """Tells whether binary file `source` is the file at `path`."""
+
+    try:
+        return os.path.samestat(os.fstat(source.fileno()), os.stat(path))
+    except (OSError, ValueError):
+        return False
+
+def main(argv=None):
+    """Runs the command line interface. Returns the exit status."""
+
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be a positive integer")
+    try:
+        engine.stream([], args.mode) # checks the mode
+    except ValueError as error:
+        parser.error(str(error))
+    if args.serve:
+        try:
+            server.serve(args.socket)
+        except OSError as error:
+            print(f"{parser.prog}: {error}", file=sys.stderr)
+            return 1
+        except KeyboardInterrupt:
+            pass
+        return 0
+    if args.input and os.path.isdir(args.input):
+        return _convert_tree(parser, args)
+
+    source = sys.stdin.buffer
+    target = sys.stdout.buffer
+    try:
+        if args.input and args.input != "-":
+            source = open(args.input, "rb")
+        if args.output and _same_file(source, args.output):
+            # Opening the output would truncate the input
+            parser.error("the input and the output are the same file")
+        if args.output:
+            target = open(args.output, "wb")
+        start = time.perf_counter()
+        nbytes = stream.convert_file(
+            source, target, args.mode, args.chunk_size,
+            stream.syntax(args.input, args.markup))
+        target.flush()
+        elapsed = time.perf_counter() - start
+    except (OSError, UnicodeDecodeError) as error:
+        print(f"{parser.prog}: {error}", file=sys.stderr)
+        return 1
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if target is not sys.stdout.buffer:
+            target.close()
+
+    if args.stats:
+        rate = nbytes / elapsed / 1e6 if elapsed > 0 else float("inf")
+        print(
+            f"{nbytes} bytes in {elapsed:.3f} s: {rate:.1f} MB/s",
+            file=sys.stderr)
+    return 0
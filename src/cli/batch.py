@@ -0,0 +1,192 @@
+"""Batch conversion of a directory tree.
+
+    python -m Warp DIRECTORY --output DIRECTORY [--jobs N] [--glob PATTERN]
+
+Converts every file of a tree matching a pattern (e.g. `*.md`) into the
+same place of an output tree. Conversion is CPU-bound, so files are
+converted by a pool of processes (`concurrent.futures.ProcessPoolExecutor`);
+every worker compiles the tables of the mode once, when it starts.
+
+Files are written atomically: the output is written to a temporary file
+next to the target and renamed over it, so a target is either the old or
+the new version (even if conversion fails or is interrupted).
+
+The content hashes of the converted files are kept in `CACHE_NAME` of the
+output tree, and a file that hasn't changed since the last run (with the
+same mode and markup) is skipped.
+"""
+
+import concurrent.futures
+import fnmatch
+import hashlib
+import json
+import os
+import tempfile
+
+from Warp import engine
+from Warp.cli import stream
+
+CACHE_NAME = ".warp-cache.json"
+HASH_CHUNK_SIZE = 1 << 20 # bytes
+
+CONVERTED = "converted"
+UNCHANGED = "unchanged"
+FAILED = "failed"
+
+def files(source, pattern, exclude=None):
+    """Returns the relative paths of the files of `source` tree matching
+    `pattern` (sorted). Directory `exclude` (e.g. the output) is skipped."""
+
+    result = []
+    for root, dirs, names in os.walk(source):
+        dirs[:] = sorted(
+            d for d in dirs
+            if exclude is None
+            or not os.path.samefile(os.path.join(root, d), exclude))
+        for name in sorted(fnmatch.filter(names, pattern)):
+            path = os.path.join(root, name)
+            result.append(os.path.relpath(path, source))
+    return result
+
+def digest(path):
+    """Returns the content hash of the file at `path`."""
+
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def write_atomic(path, write):
+    """Writes the file at `path` with `write(file)` (a binary file), by
+    renaming a complete temporary file over `path`."""
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            write(file)
+        # `mkstemp` creates private files
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temporary, 0o666 & ~umask)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+def _init_worker(mode):
+    """Initializer of the workers: compiles the tables of `mode`."""
+
+    engine.convert("", mode)
+
+def _convert(task):
+    """Converts a file (in a worker).
+
+    `task` is a `[source, target, mode, markup, cached_hash]` list. Returns
+    `[status, hash, nbytes, error]`.
+    """
+
+    source, target, mode, markup, cached_hash = task
+    try:
+        content_hash = digest(source)
+        if content_hash == cached_hash and os.path.exists(target):
+            return [UNCHANGED, content_hash, 0, None]
+        nbytes = 0
+        def write(file):
+            nonlocal nbytes
+            with open(source, "rb") as source_file:
+                nbytes = stream.convert_file(
+                    source_file, file, mode, markup=markup)
+        write_atomic(target, write)
+        return [CONVERTED, content_hash, nbytes, None]
+    except (OSError, UnicodeDecodeError) as error:
+        return [FAILED, None, 0, str(error)]
+    except Exception as error:
+        # Reported with the file, the other files are still converted
+        return [FAILED, None, 0, f"{type(error).__name__}: {error}"]
+
+def _read_cache(path, mode, markup):
+    """Returns the `relative path → hash` dictionary of the cache at `path`
+    (empty if it doesn't exist or was made with another mode or markup)."""
+
+    try:
+        with open(path, encoding="utf-8") as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if (not isinstance(cache, dict) or cache.get("mode") != mode
+            or cache.get("markup") != markup):
+        return {}
+    return cache.get("files", {})
+
+def convert_tree(source, target, mode, pattern="*.md", jobs=None,
+                 force=False, log=None, markup=stream.AUTO):
+    """Converts the files of `source` tree matching `pattern` into `target`
+    tree with `mode` using `jobs` processes (CPU count by default).
+    The markup of the files is chosen by `markup` (see `stream.syntax`).
+
+    Unchanged files are skipped unless `force` is set. `log(message)` is
+    called for every failed file. Returns a `status → [count, nbytes]`
+    dictionary (see `CONVERTED`, `UNCHANGED` and `FAILED`).
+    """
+
+    os.makedirs(target, exist_ok=True)
+    cache_path = os.path.join(target, CACHE_NAME)
+    cache = {} if force else _read_cache(cache_path, mode, markup)
+    paths = files(source, pattern, exclude=target)
+    tasks = [
+        [
+            os.path.join(source, path),
+            os.path.join(target, path),
+            mode,
+            stream.syntax(path, markup),
+            cache.get(path)]
+        for path in paths]
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(tasks) <= 1:
+        _init_worker(mode)
+        results = map(_convert, tasks)
+        executor = None
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(mode,))
+        # Files are mostly small, so they are sent in batches
+        chunksize = max(1, len(tasks) // (jobs * 8))
+        results = executor.map(_convert, tasks, chunksize=chunksize)
+
+    summary = {CONVERTED: [0, 0], UNCHANGED: [0, 0], FAILED: [0, 0]}
+    new_cache = {}
+    try:
+        for path, [status, content_hash, nbytes, error] in zip(
+                paths, results):
+            summary[status][0] += 1
+            summary[status][1] += nbytes
+            if status == FAILED:
+                if log:
+                    log(f"{os.path.join(source, path)}: {error}")
+            else:
+                new_cache[path] = content_hash
+    finally:
+        if executor:
+            executor.shutdown()
+        # Files converted so far are skipped by the next run
+        content = {"mode": mode, "markup": markup, "files": new_cache}
+        write_atomic(cache_path, lambda file: file.write(
+            json.dumps(content, indent=0).encode("utf-8")))
+    return summary
+
+def report(summary, elapsed):
+    """Returns a one-line report of `convert_tree` result."""
+
+    nfiles = sum(count for count, nbytes in summary.values())
+    converted, nbytes = summary[CONVERTED]
+    rate = 1 / elapsed if elapsed > 0 else float("inf")
+    return (
+        f"{nfiles} files in {elapsed:.2f} s: "
+        f"{converted} converted, {summary[UNCHANGED][0]} unchanged, "
+        f"{summary[FAILED][0]} failed; "
+        f"{nfiles * rate:.1f} files/s, {nbytes * rate / 1e6:.1f} MB/s")
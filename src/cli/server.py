@@ -0,0 +1,262 @@
+"""Conversion server for editor integrations.
+
+    python -m Warp --serve [--socket PATH]
+
+Starting Python for every conversion costs an editor (Vim, Emacs, VS Code,
+...) hundreds of milliseconds. The server is started once, keeps the tables
+compiled and answers requests of a JSON-lines protocol on stdin/stdout or on
+a Unix socket. Every request is a line answered by a line:
+
+    {"id": 1, "method": "convert", "params": {"text": "\\\\alpha^2"}}
+    {"id": 1, "result": "α²"}
+
+Methods and their params:
+
+    `convert`
+        `text`, `mode` (default `expr`) and `markup` (optional), see
+        `engine.convert`. The result is the converted text. Roman numbers
+        are limited by `guard.DEFAULTS`.
+    `suggest`
+        `query` and `limit` (default 10), see `engine.suggest`. The result is
+        a list of `[command, symbol]` pairs.
+    `render`
+        `kind` (`table`, `frac`, `dirtree` or a matrix kind, e.g. `pmatrix`)
+        and `args` (e.g. `[2, 3]`), see `engine.render_*`. The result is the
+        layout. Layouts are limited by `guard.DEFAULTS`.
+
+A failed request (whatever the error) is answered by `{"id": ...,
+"error": message}`. `id` is optional and copied to the answer. Requests
+may be pipelined (sent without waiting for the answers): a connection is
+read line by line and its requests are answered in order.
+
+`Client` is a minimal client (e.g. for tests and scripts).
+"""
+
+import inspect
+import itertools
+import json
+import os
+import socket
+import socketserver
+import stat
+import subprocess
+import sys
+
+from Warp import engine
+from Warp.engine import guard
+
+DEFAULT_MODE = "expr"
+DEFAULT_LIMIT = 10
+
+def _convert(text, mode=DEFAULT_MODE, markup=None):
+    """Method `convert`."""
+
+    if not isinstance(text, str):
+        raise ValueError("`text` must be a string.")
+    return engine.convert(text, mode, markup, limits=guard.DEFAULTS)
+
+def _suggest(query, limit=DEFAULT_LIMIT):
+    """Method `suggest`."""
+
+    if not isinstance(query, str):
+        raise ValueError("`query` must be a string.")
+    return engine.suggest(query, limit)
+
+def _render(kind, args=None):
+    """Method `render`."""
+
+    if args is None:
+        args = []
+    if not isinstance(kind, str) or not isinstance(args, list):
+        raise ValueError("`kind` must be a string and `args` a list.")
+    name = kind.lstrip("\\")
+    leading = []
+    if name == "table":
+        function = engine.render_table
+    elif name == "frac":
+        function = engine.render_frac
+    elif name == "dirtree":
+        function = engine.render_dirtree
+    else:
+        function = engine.render_matrix
+        leading = [kind]
+    try:
+        inspect.signature(function).bind(
+            *leading, *args, limits=guard.DEFAULTS)
+    except TypeError:
+        raise ValueError(f"Invalid args of `{kind}`: {args}.") from None
+    return function(*leading, *args, limits=guard.DEFAULTS)
+
+METHODS = {
+    "convert": _convert,
+    "suggest": _suggest,
+    "render": _render}
+
+def warm():
+    """Compiles the tables and builds the indexes used by the methods, so
+    that the first requests are as fast as the next ones."""
+
+    engine.modes()
+    engine.convert("\\alpha", DEFAULT_MODE)
+    engine.suggest("\\alpha")
+    engine.render_matrix("matrix", 1)
+    engine.render_table(1, 1)
+    engine.render_frac(1)
+    engine.render_dirtree([1])
+
+def answer(request):
+    """Returns the answer to `request` (a decoded line)."""
+
+    if not isinstance(request, dict):
+        return {"id": None, "error": "Request must be an object."}
+    response = {"id": request.get("id")}
+    name = request.get("method")
+    params = request.get("params", {})
+    if name not in METHODS:
+        response["error"] = f"Unknown method: `{name}`."
+        return response
+    if not isinstance(params, dict):
+        response["error"] = "`params` must be an object."
+        return response
+    method = METHODS[name]
+    try:
+        inspect.signature(method).bind(**params)
+    except TypeError:
+        # Missing or unexpected params
+        response["error"] = f"Invalid params of `{name}`: {sorted(params)}."
+        return response
+    try:
+        response["result"] = method(**params)
+    except ValueError as error:
+        response["error"] = str(error)
+    except Exception as error:
+        # Any failure is the answer to this request only, the server goes on
+        response["error"] = f"{type(error).__name__}: {error}"
+    return response
+
+def answer_line(line):
+    """Returns the answer line (bytes) to a request `line` (bytes)."""
+
+    try:
+        response = answer(json.loads(line))
+    except (ValueError, RecursionError) as error:
+        # RecursionError: arrays or objects nested too deeply
+        response = {"id": None, "error": f"Invalid JSON: {error}."}
+    try:
+        return json.dumps(
+            response, ensure_ascii=False).encode("utf-8") + b"\n"
+    except UnicodeEncodeError:
+        # Lone surrogates (e.g. of a `\\ud800` escape) are kept escaped
+        return json.dumps(response).encode("ascii") + b"\n"
+
+def serve_file(reader, writer):
+    """Answers the requests read from binary file `reader` to `writer` until
+    the end of `reader`."""
+
+    for line in iter(reader.readline, b""):
+        if line.strip():
+            writer.write(answer_line(line))
+            writer.flush()
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Handler of a connection to the socket."""
+
+    def handle(self):
+        serve_file(self.rfile, self.wfile)
+
+def serve(path=None):
+    """Serves on stdin/stdout, or on the Unix socket at `path` until
+    interrupted."""
+
+    warm()
+    if path is None:
+        serve_file(sys.stdin.buffer, sys.stdout.buffer)
+        return
+    if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+        raise OSError("Unix sockets aren't supported on this platform.")
+    try:
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            # Left by a previous server
+            os.unlink(path)
+    except FileNotFoundError:
+        pass
+    with socketserver.ThreadingUnixStreamServer(path, _Handler) as server:
+        server.daemon_threads = True
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(path)
+
+class Client:
+    """Client of a server.
+
+    `Client(command=[...])` starts a server (e.g. `[sys.executable, "-m",
+    "Warp", "--serve"]`) and talks to it over its stdin/stdout, and
+    `Client(path=...)` connects to the socket of a running server.
+
+    `call(method, **params)` sends a request and returns its result (an
+    error is raised as `ValueError`). Pipelined requests are sent with
+    `send` and their answers read with `receive`, in the same order (answers
+    wait in a pipe or a socket buffer, so only a bounded number of them
+    should be left unread).
+    """
+
+    def __init__(self, command=None, path=None):
+        self._ids = itertools.count(1)
+        self._process = None
+        self._socket = None
+        if path is not None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.connect(path)
+            self._reader = self._socket.makefile("rb")
+            self._writer = self._socket.makefile("wb")
+        else:
+            self._process = subprocess.Popen(
+                command or [sys.executable, "-m", "Warp", "--serve"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            self._reader = self._process.stdout
+            self._writer = self._process.stdin
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def send(self, method, **params):
+        """Sends a request without waiting for the answer. Returns its id."""
+
+        request_id = next(self._ids)
+        self._writer.write(json.dumps(
+            {"id": request_id, "method": method, "params": params},
+            ensure_ascii=False).encode("utf-8") + b"\n")
+        self._writer.flush()
+        return request_id
+
+    def receive(self):
+        """Returns the next answer (a dictionary)."""
+
+        line = self._reader.readline()
+        if not line:
+            raise EOFError("The server closed the connection.")
+        return json.loads(line)
+
+    def call(self, method, **params):
+        """Sends a request and returns its result."""
+
+        self.send(method, **params)
+        response = self.receive()
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response["result"]
+
+    def close(self):
+        """Closes the connection (and stops the started server)."""
+
+        self._writer.close()
+        if self._process:
+            self._process.wait()
+            self._reader.close()
+        else:
+            self._reader.close()
+            self._socket.close()
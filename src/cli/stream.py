@@ -0,0 +1,89 @@
+"""Streaming conversion of files.
+
+A file is read in chunks of bounded size (regular files are memory-mapped),
+decoded and converted with `engine.stream`, so memory doesn't depend on the
+size of the file.
+"""
+
+import codecs
+import io
+import mmap
+import os
+import stat
+
+from Warp import engine
+from Warp.engine import markup as markups
+
+DEFAULT_CHUNK_SIZE = 1 << 16 # bytes
+RELEASE_SIZE = 1 << 22 # bytes of a memory-mapped file released at once
+
+AUTO = "auto" # markup chosen by the extension of the file
+TEXT = "text" # no markup
+MARKUPS = [AUTO, TEXT, *markups.SYNTAXES]
+
+def syntax(path, markup=AUTO):
+    """Returns the syntax of the file at `path` (`None` for text) for
+    `markup` (see `MARKUPS`)."""
+
+    if markup == AUTO:
+        extension = os.path.splitext(path or "")[1].lower()
+        return markups.EXTENSIONS.get(extension)
+    return None if markup == TEXT else markup
+
+def read_chunks(file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yields the bytes of a binary `file` in chunks of `chunk_size`.
+
+    Regular files are memory-mapped, other files (pipes, terminals) are
+    read.
+    """
+
+    try:
+        regular = stat.S_ISREG(os.fstat(file.fileno()).st_mode)
+    except (OSError, ValueError, io.UnsupportedOperation):
+        regular = False
+    if not regular:
+        # A pipe or a terminal
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            yield chunk
+    elif os.fstat(file.fileno()).st_size > 0:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # Pages are read once, in order, and released once read (where
+            # supported), so mapped pages don't pile up in memory
+            release = hasattr(mmap, "MADV_DONTNEED")
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            released = 0
+            for start in range(0, len(mapped), chunk_size):
+                yield mapped[start:start+chunk_size]
+                end = (start + chunk_size) // mmap.PAGESIZE * mmap.PAGESIZE
+                if release and end - released >= RELEASE_SIZE:
+                    mapped.madvise(mmap.MADV_DONTNEED, released, end - released)
+                    released = end
+
+def decode(chunks, encoding="utf-8"):
+    """Decodes `chunks` of bytes (characters may be split between them)."""
+
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+def convert_file(
+        source, target, mode, chunk_size=DEFAULT_CHUNK_SIZE, markup=None):
+    """Converts binary file `source` to binary file `target` with `mode`
+    (`markup` is as of `engine.convert`).
+
+    Returns the number of bytes read.
+    """
+
+    nbytes = 0
+    def counted(chunks):
+        nonlocal nbytes
+        for chunk in chunks:
+            nbytes += len(chunk)
+            yield chunk
+
+    chunks = decode(counted(read_chunks(source, chunk_size)))
+    for output in engine.stream(chunks, mode, markup):
+        target.write(output.encode("utf-8"))
+    return nbytes
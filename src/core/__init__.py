@@ -0,0 +1,209 @@
+"""Conversion core.
+
+`Automaton` finds the commands of a mapping table (e.g. an index of
+`Warp.engine` module's `MAPPING_*`) in text and converts them. All the
+mapping-based categories use it, so matching is implemented (and optimized)
+in one place.
+
+`stream` (or `Stream`) converts text that doesn't fit in memory (read in
+chunks) with a tokenizer such as `Automaton.tokens`.
+
+Like `Warp.engine`, this package doesn't depend on Keypirinha.
+"""
+
+import re
+
+PASS = "pass" # characters that are not commands are copied to the output
+DROP = "drop" # characters that are not commands are dropped
+
+MAX_CARRY = 1 << 20 # characters of an unfinished token kept by `stream`
+
+class Automaton:
+    """Longest-match automaton of a `command → output` dictionary.
+
+    The commands are stored in a trie, which is compiled into a regular
+    expression following its branches (e.g. `\\beta`, `\\bar` and `b` become
+    `\\\\(?:beta|bar)|b`), so the matching itself runs in `re`. At every
+    position the longest command is taken and the scan continues after it.
+    Only one path of the trie is followed from a position, so conversion is
+    linear in the length of the text whatever the size of the table (and
+    bounded by the length of the longest command).
+
+    Commands without continuations (e.g. all the characters of a font) are
+    matched by a single character class. If all the commands are single
+    characters, `convert` uses `str.translate`.
+    """
+
+    def __init__(self, index):
+        """`index` is a `command → output` dictionary (see `mapping`)."""
+
+        self.index = index
+        trie = {}
+        for command in filter(None, index):
+            node = trie
+            for char in command:
+                node = node.setdefault(char, {})
+            node[""] = {} # end of a command
+        self.pattern = re.compile(_expression(trie) or "(?!)")
+        self.longest = max(map(len, index), default=1)
+        self._single = all(len(command) == 1 for command in index)
+        self._table = None
+
+    def finditer(self, text, start=0):
+        """Yields `(start, end, output)` of the commands found in `text`."""
+
+        index = self.index
+        for match in self.pattern.finditer(text, start):
+            yield match.start(), match.end(), index[match.group()]
+
+    def tokens(self, text, start=0, policy=PASS):
+        """Yields `(end, piece)` pairs of `text` converted from `start`.
+
+        `piece` is the output for `text` from the end of the previous pair
+        (or `start`) up to `end` (empty for characters dropped by `DROP`).
+        Scanning can be restarted at any `end` (see `Warp.cat.incremental`
+        and `stream`). Characters at the end of `text` that may start a
+        command continued after it are a separate piece.
+        """
+
+        if policy == PASS and self._single:
+            # No command continues after a character: one piece
+            if start < len(text):
+                yield len(text), self.convert(text[start:])
+            return
+        pos = start
+        for begin, end, output in self.finditer(text, start):
+            if begin > pos:
+                yield begin, text[pos:begin] if policy == PASS else ""
+            pos = end
+            yield end, output
+        if pos < len(text):
+            split = max(pos, len(text) - self.longest + 1)
+            if split > pos:
+                yield split, text[pos:split] if policy == PASS else ""
+            yield len(text), text[split:] if policy == PASS else ""
+
+    def convert(self, text, policy=PASS):
+        """Converts `text` in one pass (see `PASS` and `DROP`)."""
+
+        if policy == PASS and self._single:
+            if self._table is None:
+                self._table = str.maketrans(self.index)
+            return text.translate(self._table)
+        if policy == PASS:
+            index = self.index
+            return self.pattern.sub(lambda match: index[match.group()], text)
+        return "".join([self.index[c] for c in self.pattern.findall(text)])
+
+    def converts(self, text):
+        """Returns `True` if `text` is a non-empty sequence of commands."""
+
+        length = 0
+        for match in self.pattern.finditer(text):
+            if match.start() != length:
+                return False
+            length = match.end()
+        return length > 0 and length == len(text)
+
+class Stream:
+    """Converter of text pushed in chunks (see `stream`).
+
+    `feed(chunk)` returns the final output of the text so far and `close()`
+    the output of the rest, after which the converter starts a new text.
+    """
+
+    def __init__(self, tokenize, lookahead=0):
+        self._tokenize = tokenize
+        self._lookahead = lookahead
+        self._carry = ""
+
+    def feed(self, chunk):
+        """Converts `chunk` appended to the unfinished end of the text."""
+
+        text = self._carry + chunk
+        limit = len(text) - self._lookahead
+        if len(self._carry) > MAX_CARRY:
+            limit = len(text)
+        pieces = []
+        cut = 0
+        for end, piece in self._tokenize(text, 0):
+            if end > limit:
+                break
+            pieces.append(piece)
+            cut = end
+        self._carry = text[cut:]
+        return "".join(pieces)
+
+    def close(self):
+        """Converts the unfinished end of the text as its end."""
+
+        carry = self._carry
+        self._carry = ""
+        if not carry:
+            return ""
+        return "".join([piece for end, piece in self._tokenize(carry, 0)])
+
+def stream(chunks, tokenize, lookahead=0):
+    """Converts an iterable of text `chunks`, yielding the output in pieces.
+
+    `tokenize(text, start)` must yield `(end, piece)` pairs as
+    `Automaton.tokens` does (restartable at any `end`), where a piece may
+    depend on up to `lookahead` characters after its `end` (e.g. a command
+    may continue). Every chunk is appended to the unfinished end of the
+    previous one, and the pieces followed by `lookahead` characters are
+    final, so commands spanning chunks are converted as in one text.
+
+    Only the unfinished end is kept between chunks, so memory doesn't depend
+    on the size of the text. If it grows over `MAX_CARRY` characters (e.g.
+    an unclosed group), it is converted as if the text ended there.
+    """
+
+    converter = Stream(tokenize, lookahead)
+    for chunk in chunks:
+        yield converter.feed(chunk)
+    output = converter.close()
+    if output:
+        yield output
+
+def _expression(node):
+    """Returns a regular expression of a trie `node` (longest match first)."""
+
+    branches = []
+    leaves = []
+    for char, child in node.items():
+        if not char:
+            continue
+        if list(child) == [""]:
+            leaves.append(ord(char))
+        else:
+            branches.append(re.escape(char) + _expression(child))
+    if leaves:
+        branches.append(_character_class(leaves))
+    if not branches:
+        return ""
+    expression = branches[0] if len(branches) == 1 else (
+        "(?:" + "|".join(branches) + ")")
+    if "" in node:
+        # Greedy: a longer command is tried first
+        expression = f"(?:{expression})?"
+    return expression
+
+def _character_class(codes):
+    """Returns a character class of `codes` written as ranges.
+
+    Fonts are runs of consecutive code points, and `re` searches a class of
+    ranges much faster than a class of single characters.
+    """
+
+    ranges = []
+    for code in sorted(codes):
+        if ranges and code == ranges[-1][1] + 1:
+            ranges[-1][1] = code
+        else:
+            ranges.append([code, code])
+    if len(ranges) == 1 and ranges[0][0] == ranges[0][1]:
+        return re.escape(chr(ranges[0][0]))
+    return "[" + "".join(
+        re.escape(chr(first)) if first == last
+        else f"{re.escape(chr(first))}-{re.escape(chr(last))}"
+        for first, last in ranges) + "]"
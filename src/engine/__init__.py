@@ -0,0 +1,214 @@
+"""Warp conversion engine.
+
+Conversions, layouts and symbol search of Warp without the launcher. Every
+module of this package holds the tables and the functions of a category, and
+the modules of `Warp.cat` are thin Keypirinha adapters over them. Nothing
+here depends on Keypirinha, so the engine runs on plain CPython (e.g. in
+scripts):
+
+    >>> from Warp import engine
+    >>> engine.convert("\\\\alpha_i^2 \\\\in \\\\mathbb{R}", "expr")
+    'αᵢ² ∈ ℝ'
+    >>> print(engine.render_matrix("pmatrix", 2, 3))
+    ⎛ x  x  x ⎞
+    ⎜         ⎟
+    ⎝ x  x  x ⎠
+
+Text that doesn't fit in memory is converted in chunks with `stream` (see
+also `Warp.cli`).
+
+Modes and kinds are keywords of the categories (e.g. `\\mathbb`, `^`,
+`\\pmatrix`); the leading backslash may be omitted. Invalid arguments raise
+`ValueError` with the same message as the launcher's error item.
+
+Modules hold large mapping tables, so they are imported on first use (as
+category modules are).
+"""
+
+import functools
+import importlib
+
+from Warp import core
+
+_converters = {}
+_limited = set() # keywords of the converters checked against limits
+_indexes = {}
+
+def _module(name):
+    """Imports the engine module `name`."""
+
+    return importlib.import_module(f"{__name__}.{name}")
+
+def _keyword(name, keywords):
+    """Returns the keyword of `keywords` named `name` (with or without
+    the leading backslash)."""
+
+    for keyword in [name, "\\" + name]:
+        if keyword in keywords:
+            return keyword
+    raise ValueError(f"Unknown keyword: `{name}`.")
+
+def _checked(output, error_indicator):
+    """Returns `output` or raises it as an error."""
+
+    if error_indicator:
+        raise ValueError(output)
+    return output
+
+def _load_converters():
+    """Fills `_converters`: a `keyword → function(text)` dictionary."""
+
+    base = _module("base")
+    diacritical = _module("diacritical")
+    expression = _module("expression")
+    fonts = _module("fonts")
+    operations = _module("operations")
+    roman = _module("roman")
+    unwarp = _module("unwarp")
+
+    def script(keyword):
+        return lambda text: base.construct_output(text, keyword)
+
+    def font(keyword):
+        return lambda text: fonts.construct_output(text, keyword)[0]
+
+    def accent(mark):
+        return lambda text: diacritical.construct_output(text, mark)
+
+    def numeral(keyword):
+        return lambda text, limits=None: _checked(
+            *roman.construct_output(text, keyword, limits))
+
+    def frac(text):
+        output = operations.INDEX_FRAC.get(text)
+        if output is None:
+            output = operations.construct_frac(text)
+        if not output:
+            raise ValueError(
+                f"Fraction must be in form of `{{x}}{{y}}`. "
+                f"Wrong input: `{text}`.")
+        return output
+
+    converters = {}
+    converters.update({keyword: script(keyword) for keyword in base.KEYWORDS})
+    converters.update({
+        keyword: font(keyword) for keyword in fonts.KEYWORD_STYLES})
+    converters.update({
+        command: accent(mark)
+        for command, mark in diacritical.INDEX_DIACRITICAL.items()})
+    converters.update({
+        keyword: numeral(keyword) for keyword in roman.KEYWORDS})
+    converters[operations.KEYWORD_FRAC] = frac
+    converters[expression.KEYWORD_EXPRESSION] = expression.construct_output
+    converters[unwarp.KEYWORD_UNWARP] = unwarp.construct_output
+    _converters.update(converters)
+    _limited.update(roman.KEYWORDS)
+
+def modes():
+    """Returns the conversion modes of `convert` (keywords)."""
+
+    if not _converters:
+        _load_converters()
+    return list(_converters)
+
+def _syntax(markup):
+    """Returns the syntax of `markup` (see `markup.SYNTAXES`)."""
+
+    if markup not in _module("markup").SYNTAXES:
+        raise ValueError(f"Unknown markup: `{markup}`.")
+    return markup
+
+def convert(text, mode, markup=None, limits=None):
+    """Converts `text` with a conversion `mode` (see `modes`).
+
+    E.g. `convert("x", "mathbb")` is `𝕩` and `convert("ℝ²", "unwarp")` is
+    `\\mathbb{R}^{2}`. If `markup` is specified (e.g. `markdown`), `text`
+    is a document whose code and math are left unchanged (see `markup`).
+    If `limits` are specified, modes whose output grows with a number
+    (roman numbers) are checked against them (see `guard`).
+    """
+
+    keyword = _keyword(mode, modes())
+    function = _converters[keyword]
+    if limits is not None and keyword in _limited:
+        function = functools.partial(function, limits=limits)
+    if markup is None:
+        return function(text)
+    return _module("markup").convert(text, _syntax(markup), function)
+
+def stream(chunks, mode, markup=None):
+    """Converts an iterable of text `chunks` with `mode`, yielding the output
+    in pieces (see `core.stream`). `markup` is as of `convert`.
+
+    Only expressions (`expr`), superscripts, subscripts and font styles can be
+    streamed: their output is the same as of `convert` of the whole text
+    however it is split into chunks.
+    """
+
+    base = _module("base")
+    expression = _module("expression")
+    fonts = _module("fonts")
+    keyword = _keyword(mode, [
+        expression.KEYWORD_EXPRESSION, *base.KEYWORDS, *fonts.KEYWORD_STYLES])
+    if keyword == expression.KEYWORD_EXPRESSION:
+        tokenize = expression.tokens
+        lookahead = expression.LOOKAHEAD
+    else:
+        module = base if keyword in base.KEYWORDS else fonts
+        tokenize = lambda text, start: module.tokens(text, start, keyword)
+        lookahead = module.LOOKAHEAD
+    if markup is None:
+        return core.stream(chunks, tokenize, lookahead)
+    return _module("markup").stream(
+        chunks, _syntax(markup), tokenize, lookahead)
+
+def suggest(query, limit=10):
+    """Returns up to `limit` `[command, symbol]` pairs of the symbols
+    matching `query` (e.g. `\\alp`, `\\lamda` or `not equal`), the best ones
+    first (see `search`). Symbols are also described by their `TAGS` (e.g.
+    `blackboard`)."""
+
+    index = _indexes.get("symbols")
+    if index is None:
+        symbols = _module("symbols")
+        index = _module("search").Index([
+            [command, [command, symbol], symbol,
+             *symbols.TAGS.get(command, [])]
+            for command, symbol in symbols.INDEX_SYMBOLS.items()])
+        _indexes["symbols"] = index
+    return index.search(query)[:limit]
+
+def render_matrix(kind, m, n=None, limits=None):
+    """Returns a matrix of `m` rows and `n` columns (or cases of `m` rows).
+
+    `kind` is a keyword of `matrix` (e.g. `pmatrix`, `cases`). A matrix is
+    square if `n` is `None`. If `limits` are specified, the dimensions are
+    checked against them (see `guard`).
+    """
+
+    matrix = _module("matrix")
+    dims = ",".join(str(dim) for dim in [m, n] if dim is not None)
+    target, short_desc, error_indicator = matrix.construct_output(
+        dims, _keyword(kind, matrix.KEYWORDS), limits=limits)
+    return _checked(target, error_indicator)
+
+def render_table(m, n, width=10, limits=None):
+    """Returns a Markdown-style table of `m` rows and `n` columns."""
+
+    output, short_desc, error_indicator = _module("table").construct_output(
+        f"{m},{n},{width}", limits=limits)
+    return _checked(output, error_indicator)
+
+def render_frac(length, limits=None):
+    """Returns a three-lines fraction (`\\Frac`) of `length`."""
+
+    target, short_desc, error_indicator = _module(
+        "operations").construct_ffrac(str(length), limits=limits)
+    return _checked(target, error_indicator)
+
+def render_dirtree(levels, limits=None):
+    """Returns a directory tree of `levels` (e.g. `[1, 2, 3, 2]`)."""
+
+    output, error_indicator = _module("dirtree").construct_output(
+        ",".join(str(level) for level in levels), limits=limits)
+    return _checked(output, error_indicator)
@@ -0,0 +1,187 @@
+"""Superscripts and subscripts.
+
+LaTeX superscript (`^`) and subscript (`_`) commands.
+Supports some greek letters (but not all), e.g. `\\beta` in superscript is
+`ᵝ`. The match must be exact, and other characters are ignored (e.g. `a%h` in
+subscript is `ₐₕ`).
+"""
+
+from Warp import core
+from Warp.engine import mapping
+
+KEYWORD_SUPERSCRIPT = "^"
+KEYWORD_SUBSCRIPT = "_"
+
+MAPPING_SUPERSCRIPT = [
+    # Punctuation
+    ["!", "ᵎ"],
+    [".", "ᐧ"],
+    [",", ","],
+    # Numbers
+    ["0", "⁰"],
+    ["1", "¹"],
+    ["2", "²"],
+    ["3", "³"],
+    ["4", "⁴"],
+    ["5", "⁵"],
+    ["6", "⁶"],
+    ["7", "⁷"],
+    ["8", "⁸"],
+    ["9", "⁹"],
+    # Math Symbols
+    ["+", "⁺"],
+    ["-", "⁻"],
+    ["=", "⁼"],
+    ["(", "⁽"],
+    [")", "⁾"],
+    ["\dot", "ᐧ"],
+    ["\\times", "ᕁ"],
+    ["\\neq", "ᙾ"],
+    # Latin Small Letters
+    ["a", "ᵃ"],
+    ["b", "ᵇ"],
+    ["c", "ᶜ"],
+    ["d", "ᵈ"],
+    ["e", "ᵉ"],
+    ["f", "ᶠ"],
+    ["g", "ᵍ"],
+    ["h", "ʰ"],
+    ["i", "ⁱ"],
+    ["j", "ʲ"],
+    ["k", "ᵏ"],
+    ["l", "ˡ"],
+    ["m", "ᵐ"],
+    ["n", "ⁿ"],
+    ["o", "ᵒ"],
+    ["p", "ᵖ"],
+    ["q", "ᑫ"], # displacement
+    ["r", "ʳ"],
+    ["s", "ˢ"],
+    ["t", "ᵗ"],
+    ["u", "ᵘ"],
+    ["v", "ᵛ"],
+    ["w", "ʷ"],
+    ["x", "ˣ"],
+    ["y", "ʸ"],
+    ["z", "ᶻ"],
+    # Latin Capital Letters
+    ["A", "ᴬ"],
+    ["B", "ᴮ"],
+    ["C", "ᶜ"], # displacement from small letters
+    ["D", "ᴰ"],
+    ["E", "ᴱ"],
+    ["F", "ᶠ"], # displacement from small letters
+    ["G", "ᴳ"],
+    ["H", "ᴴ"],
+    ["I", "ᴵ"],
+    ["J", "ᴶ"],
+    ["K", "ᴷ"],
+    ["L", "ᴸ"],
+    ["M", "ᴹ"],
+    ["N", "ᴺ"],
+    ["O", "ᴼ"],
+    ["P", "ᴾ"],
+    ["Q", "Q"], # displacement
+    ["R", "ᴿ"],
+    ["s", "ˢ"], # displacement from small letters
+    ["T", "ᵀ"],
+    ["U", "ᵁ"],
+    ["V", "ⱽ"],
+    ["W", "ᵂ"],
+    ["x", "ˣ"], # displacement from small letters
+    ["y", "ʸ"], # displacement from small letters
+    ["z", "ᶻ"], # displacement from small letters
+    # Greek Letters
+    ["\\beta", "ᵝ"],
+    ["\\gamma", "ᵞ"],
+    ["\\delta", "ᵟ"],
+    ["\\Delta", "ᐞ"],
+    ["\\theta", "ᶿ"],
+    ["\\phi", "ᶲ"],
+    ["\\psi", "ᵠ"],
+    ["\\upsilon", "ᶹ"],
+    ["\\zeta", "ᶼ"],
+    ["\\Omega", "ᶷ"],
+    ["\\chi", "ᵡ"]]
+
+MAPPING_SUBSCRIPT = [
+    # Numbers
+    ["0", "₀"],
+    ["1", "₁"],
+    ["2", "₂"],
+    ["3", "₃"],
+    ["4", "₄"],
+    ["5", "₅"],
+    ["6", "₆"],
+    ["7", "₇"],
+    ["8", "₈"],
+    ["9", "₉"],
+    # Math Symbols
+    ["+", "₊"],
+    ["-", "₋"],
+    ["=", "₌"],
+    ["(", "₍"],
+    [")", "₎"],
+    # Latin Letters
+    ["a", "ₐ"],
+    ["b", "₆"], # displacement
+    ["c", "꜀"], # displacement
+    ["d", "ₔ"], # displacement
+    ["e", "ₑ"],
+    ["f", "բ"], # displacement
+    ["g", "₉"], # displacement
+    ["h", "ₕ"],
+    ["i", "ᵢ"],
+    ["j", "ⱼ"],
+    ["k", "ₖ"],
+    ["l", "ₗ"],
+    ["m", "ₘ"],
+    ["n", "ₙ"],
+    ["o", "ₒ"],
+    ["p", "ₚ"],
+    ["q", "q"],
+    ["r", "ᵣ"],
+    ["s", "ₛ"],
+    ["t", "ₜ"],
+    ["u", "ᵤ"],
+    ["v", "ᵥ"],
+    ["w", "ᵥᵥ"],
+    ["x", "ₓ"],
+    ["y", "ᵧ"], # displacement
+    ["z", "₂"], # displacement
+    # Greek Letters
+    ["\\beta", "ᵦ"],
+    ["\\gamma", "ᵧ"],
+    ["\\rho", "ᵨ"],
+    ["\\psi", "ᵩ"],
+    ["\\chi", "ᵪ"]]
+
+INDEX_SUPERSCRIPT = mapping.index(MAPPING_SUPERSCRIPT)
+INDEX_SUBSCRIPT = mapping.index(MAPPING_SUBSCRIPT)
+
+COMPILED_SUPERSCRIPT = core.Automaton(INDEX_SUPERSCRIPT)
+COMPILED_SUBSCRIPT = core.Automaton(INDEX_SUBSCRIPT)
+
+COMPILED = {
+    KEYWORD_SUPERSCRIPT: COMPILED_SUPERSCRIPT,
+    KEYWORD_SUBSCRIPT: COMPILED_SUBSCRIPT}
+
+KEYWORDS = [KEYWORD_SUPERSCRIPT, KEYWORD_SUBSCRIPT]
+
+# Characters a command may read after the end of the previous one
+LOOKAHEAD = max(len(c) for c in [*INDEX_SUPERSCRIPT, *INDEX_SUBSCRIPT]) - 1
+
+def construct_output(user_input, prev_target):
+    """Converts `user_input` string to superscript or subscript characters.
+
+    `prev_target` is a keyword (see `KEYWORDS`). Characters that can't be
+    converted are dropped.
+    """
+
+    return COMPILED[prev_target].convert(user_input, core.DROP)
+
+def tokens(user_input, start, prev_target):
+    """Yields `(end, piece)` pairs of `user_input` converted from `start`
+    (see `core.Automaton.tokens`)."""
+
+    return COMPILED[prev_target].tokens(user_input, start, core.DROP)
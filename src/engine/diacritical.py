@@ -0,0 +1,74 @@
+"""Diacritical symbols.
+
+Adds diacritical modifier characters (combining marks).
+"""
+
+import re
+
+from Warp.engine import mapping
+from Warp.engine import symbols
+
+MAPPING_DIACRITICAL = [
+    ["\\overline", "\u0305"],
+    # ["\\underline", "\u0332"],
+    # ["\\widehat", "\u0302"],
+    # ["\\widetilde", "\u0303"],
+    # ["\\overrightarrow", "\u20D7"],
+    ["\\overleftarrow", "\u20D6"],
+    ["\\acute", "\u0301"],
+    # ["\\\'", "\u0301"],
+    ["\\breve", "\u0306"],
+    # ["\\u", "\u0306"],
+    ["\\ddot", "\u0308"],
+    # ["\\\"", "\u0308"],
+    ["\\grave", "\u0300"],
+    ["\\tilde", "\u0303"],
+    ["\\bar", "\u0304"],
+    ["\\check", "\u030C"],
+    ["\\dot", "\u0307"],
+    # ["\\.", "\u0307"],
+    ["\\hat", "\u0302"],
+    ["\\vec", "\u20D7"],
+    # ["\\b", "\u0332"],
+    ["\\r", "\u030A"],
+    ["\\t", "\u0311"],
+    # ["\\^", "\u0302"],
+    ["\\H", "\u030B"],
+    # ["\\v", "\u030C"],
+    # ["\\\`", "\u0300"],
+    # ["\\t", "\u0361"],
+    # ["\\~", "\u0303"],
+    ["\\c", "\u0327"],
+    # ["\\=", "\u0305"],
+    ["\\d", "\u0323"],
+    ["\\uline", "\u0332"], # ulem package
+    ["\\uuline", "\u0333"], # ulem package
+    ["\\uwave", "\u0330"], # ulem package
+    ["\\sout", "\u0336"], # ulem package
+    ["\\xout", "\u0338"], # ulem package
+    ["\\dashuline", "\u0331"], # ulem package
+    ["\\dotuline", "\u0324"]] # ulem package
+
+INDEX_DIACRITICAL = mapping.index(MAPPING_DIACRITICAL)
+REVERSE_DIACRITICAL = mapping.reverse_index(MAPPING_DIACRITICAL)
+
+# A character with its combining marks (Combining Diacritical Marks blocks)
+_CLUSTER = re.compile(
+    "(?s).[\u0300-\u036F\u1AB0-\u1AFF\u1DC0-\u1DFF\u20D0-\u20FF\uFE20-\uFE2F]*")
+
+KEYWORDS = [s[0] for s in MAPPING_DIACRITICAL]
+
+def construct_output(user_input, prev_target):
+    """Converts `user_input` string to output string.
+    
+    `prev_target` is a diacritical symbol (target of `MAPPING_DIACRITICAL`).
+    """
+
+    if user_input in symbols.INDEX_SYMBOLS:
+        # Exact match (one symbol)
+        output = symbols.INDEX_SYMBOLS[user_input] + prev_target
+    else:
+        # All symbols (after their marks, if they have some)
+        output = _CLUSTER.sub(
+            lambda match: match.group() + prev_target, user_input)
+    return output
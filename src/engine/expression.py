@@ -0,0 +1,205 @@
+"""Inline LaTeX-like expressions.
+
+Converts a whole expression at once: symbols, superscripts and subscripts,
+fractions, math fonts and diacritical symbols (accents).
+Commands that can't be converted are left unchanged.
+"""
+
+import re
+
+from Warp import core
+from Warp.engine import base
+from Warp.engine import diacritical
+from Warp.engine import fonts
+from Warp.engine import operations
+from Warp.engine import symbols
+
+KEYWORD_EXPRESSION = "\\expr" # additional
+
+MAX_DEPTH = 100 # nesting of groups and arguments
+LOOKAHEAD = 1 # characters read after an element (see `tokens`)
+
+KEYWORDS = [KEYWORD_EXPRESSION]
+
+# Search words of the keyword (see `search`)
+TAGS = {KEYWORD_EXPRESSION: ["inline", "formula", "equation"]}
+
+_COMMAND = re.compile(r"\\(?:[A-Za-z]+|.?)", re.DOTALL)
+_PLAIN = re.compile(r"[^\\^_{}]+")
+
+class _Parser:
+    """Recursive-descent parser of an expression.
+
+        expression := (plain | command | script | group)*
+        script     := ("^" | "_") argument
+        group      := "{" expression "}"
+        argument   := group | command | character
+
+    Symbols are commands without arguments. Fonts and accents take one
+    argument and `\\frac` takes two. Groups and arguments are converted while
+    being read, so every character is read once (scripts and fractions also
+    read the source of their arguments once more).
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+
+    def expression(self, depth=0):
+        """Converts the text up to its end or up to the end of the group."""
+
+        text = self.text
+        pieces = []
+        while self.pos < len(text):
+            if text[self.pos] == "}" and depth > 0:
+                break
+            pieces.append(self.element(depth))
+        return "".join(pieces)
+
+    def element(self, depth=0):
+        """Reads plain text, a command, a script or a group and returns its
+        output."""
+
+        text = self.text
+        char = text[self.pos]
+        if char == "\\":
+            return self.command(depth)
+        if char in "^_":
+            return self.script(depth)
+        if char == "{" and depth < MAX_DEPTH:
+            source, output = self.group(depth)
+            return output
+        match = _PLAIN.match(text, self.pos)
+        end = match.end() if match else self.pos + 1
+        if end == len(text) and end - self.pos > 1:
+            # Plain text is final (see `tokens`), only its end isn't
+            end -= 1
+        start = self.pos
+        self.pos = end
+        return text[start:end]
+
+    def group(self, depth):
+        """Reads `{...}` and returns its source and its output.
+
+        An unclosed group ends with the text.
+        """
+
+        start = self.pos + 1
+        self.pos = start
+        output = self.expression(depth + 1)
+        source = self.text[start:self.pos]
+        if self.pos < len(self.text):
+            self.pos += 1
+        return source, output
+
+    def argument(self, depth):
+        """Reads an argument and returns its source and its output.
+
+        Both are empty if the argument is missing (or is a group nested
+        deeper than `MAX_DEPTH`).
+        """
+
+        text = self.text
+        while self.pos < len(text) and text[self.pos] == " ":
+            self.pos += 1
+        if self.pos >= len(text) or text[self.pos] == "}":
+            return "", ""
+        if text[self.pos] == "{":
+            if depth >= MAX_DEPTH:
+                # Too deep, the group is left to the enclosing expression
+                return "", ""
+            return self.group(depth)
+        start = self.pos
+        if text[start] == "\\":
+            output = self.command(depth + 1)
+        else:
+            self.pos += 1
+            output = text[start]
+        return text[start:self.pos], output
+
+    def command(self, depth):
+        """Reads a command (with its arguments) and returns its output."""
+
+        match = _COMMAND.match(self.text, self.pos)
+        self.pos = match.end()
+        name = match.group()
+        if name in symbols.INDEX_SYMBOLS:
+            return symbols.INDEX_SYMBOLS[name]
+        if depth >= MAX_DEPTH:
+            return name
+        if name in fonts.KEYWORD_STYLES:
+            source, output = self.argument(depth)
+            target, short_desc = fonts.construct_output(output, name)
+            return target if source else name
+        if name in diacritical.INDEX_DIACRITICAL:
+            source, output = self.argument(depth)
+            return diacritical.construct_output(
+                output, diacritical.INDEX_DIACRITICAL[name]) if source else name
+        if name == operations.KEYWORD_FRAC:
+            numerator, numerator_output = self.argument(depth)
+            denominator, denominator_output = self.argument(depth)
+            return _frac(
+                numerator, denominator, numerator_output, denominator_output)
+        if self.text.startswith("{", self.pos):
+            # Unknown command, its group is left in braces
+            source, output = self.group(depth)
+            return f"{name}{{{output}}}"
+        return name
+
+    def script(self, depth):
+        """Reads a superscript or a subscript and returns its output.
+
+        The argument is converted with `base` if all of it can be, otherwise
+        it is left as an ordinary expression after `^` or `_`.
+        """
+
+        marker = self.text[self.pos]
+        self.pos += 1
+        if depth >= MAX_DEPTH:
+            return marker
+        source, output = self.argument(depth + 1)
+        if marker == base.KEYWORD_SUPERSCRIPT:
+            compiled = base.COMPILED_SUPERSCRIPT
+        else:
+            compiled = base.COMPILED_SUBSCRIPT
+        source = source.replace(" ", "")
+        if compiled.converts(source):
+            return compiled.convert(source, core.DROP)
+        if len(output) > 1:
+            output = f"({output})"
+        return marker + output
+
+def _frac(numerator, denominator, numerator_output, denominator_output):
+    """Returns a fraction of `numerator` and `denominator` (sources).
+
+    The fraction is a single character (e.g. `½`) or is built with
+    `operations`. If the sources can't be written in superscript and
+    subscript characters, the outputs are separated by a slash.
+    """
+
+    key = f"{{{numerator}}}{{{denominator}}}"
+    if key in operations.INDEX_FRAC:
+        return operations.INDEX_FRAC[key]
+    if (base.COMPILED_SUPERSCRIPT.converts(numerator)
+            and base.COMPILED_SUBSCRIPT.converts(denominator)):
+        return operations.construct_frac(key)
+    return f"{numerator_output}/{denominator_output}"
+
+def construct_output(user_input):
+    """Converts `user_input` expression to output string."""
+
+    return _Parser(user_input).expression()
+
+def tokens(user_input, start=0):
+    """Yields `(end, piece)` pairs of `user_input` converted from `start`.
+
+    Every piece is the output of a top-level element (see `_Parser`), so
+    conversion can be restarted at any `end`. An element is read up to the
+    character after it (e.g. `\\alpha` may continue), see `LOOKAHEAD`.
+    """
+
+    parser = _Parser(user_input)
+    parser.pos = start
+    while parser.pos < len(user_input):
+        piece = parser.element()
+        yield parser.pos, piece
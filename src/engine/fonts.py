@@ -0,0 +1,156 @@
+"""Math fonts.
+
+Math fonts (styles of the Mathematical Alphanumeric Symbols block) with
+LaTeX-like and some extra commands.
+"""
+
+from Warp import core
+
+KEYWORD_MATHCAL = "\\mathcal" # LaTeX math environment
+KEYWORD_MATHBFCAL = "\\mathbfcal" # additional
+KEYWORD_MATHBB = "\\mathbb" # LaTeX math environment
+KEYWORD_MATHFRAK = "\\mathfrak" # LaTeX math environment
+KEYWORD_MATHBFFRAK = "\\mathbffrak" # additional
+KEYWORD_MATHSF = "\\mathsf" # LaTeX math environment
+KEYWORD_TEXTSF = "\\textsf" # pure LaTeX
+KEYWORD_MATHBFSF = "\\mathbfsf" # additional
+KEYWORD_MATHSFIT = "\\mathsfit" # additional
+KEYWORD_MATHBFSFIT = "\\mathbfsfit" # additional
+KEYWORD_MATHBF = "\\mathbf" # LaTeX math environment
+KEYWORD_TEXTBF = "\\textbf" # pure LaTeX
+KEYWORD_MATHBI = "\\mathbi" # LaTeX math environment
+KEYWORD_TEXTIT = "\\textit" # pure LaTeX
+KEYWORD_TEXTTT = "\\texttt" # pure LaTeX
+KEYWORD_FONTS = "\\fonts" # additional, preview of all styles
+
+# Search words of the keywords (see `search`)
+TAGS = {
+    KEYWORD_MATHBB: ["blackboard", "bold"],
+    KEYWORD_MATHFRAK: ["gothic", "blackletter"],
+    KEYWORD_MATHBFFRAK: ["gothic", "blackletter"],
+    KEYWORD_TEXTTT: ["typewriter", "monospace"],
+    KEYWORD_FONTS: ["fonts", "styles", "preview"]}
+
+LATIN = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+GREEK = "ΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡϴΣΤΥΦΧΨΩ∇αβγδεζηθικλμνξοπρςστυφχψω∂ϵϑϰϕϱϖ"
+DIGITS = "0123456789"
+
+# Mathematical Alphanumeric Symbols block (`U+1D400`-`U+1D7FF`).
+# Every style is a run of consecutive code points for `LATIN`, `GREEK` and
+# `DIGITS` (in this order). `None` means that the style has no such run.
+STYLES = {
+    "bold": [0x1D400, 0x1D6A8, 0x1D7CE],
+    "italic": [0x1D434, 0x1D6E2, None],
+    "bold italic": [0x1D468, 0x1D71C, 0x1D7CE], # digits are bold
+    "script": [0x1D49C, None, None],
+    "bold script": [0x1D4D0, None, None],
+    "fraktur": [0x1D504, None, None],
+    "double-struck": [0x1D538, None, 0x1D7D8],
+    "bold fraktur": [0x1D56C, None, None],
+    "sans-serif": [0x1D5A0, None, 0x1D7E2],
+    "sans-serif bold": [0x1D5D4, 0x1D756, 0x1D7EC],
+    "sans-serif italic": [0x1D608, None, None],
+    "sans-serif bold italic": [0x1D63C, 0x1D790, 0x1D7EC], # digits are bold
+    "monospace": [0x1D670, None, 0x1D7F6]}
+
+# Holes of the block: these characters were encoded earlier in the
+# Letterlike Symbols block (`U+2100`-`U+214F`).
+EXCEPTIONS = {
+    "italic": {"h": "ℎ"},
+    "script": {
+        "B": "ℬ", "E": "ℰ", "F": "ℱ", "H": "ℋ", "I": "ℐ", "L": "ℒ", "M": "ℳ",
+        "R": "ℛ", "e": "ℯ", "g": "ℊ", "o": "ℴ"},
+    "fraktur": {"C": "ℭ", "H": "ℌ", "I": "ℑ", "R": "ℜ", "Z": "ℨ"},
+    "double-struck": {
+        "C": "ℂ", "H": "ℍ", "N": "ℕ", "P": "ℙ", "Q": "ℚ", "R": "ℝ", "Z": "ℤ"}}
+
+KEYWORD_STYLES = {
+    KEYWORD_MATHCAL: "script",
+    KEYWORD_MATHBFCAL: "bold script",
+    KEYWORD_MATHBB: "double-struck",
+    KEYWORD_MATHFRAK: "fraktur",
+    KEYWORD_MATHBFFRAK: "bold fraktur",
+    KEYWORD_MATHSF: "sans-serif",
+    KEYWORD_TEXTSF: "sans-serif",
+    KEYWORD_MATHBFSF: "sans-serif bold",
+    KEYWORD_MATHSFIT: "sans-serif italic",
+    KEYWORD_MATHBFSFIT: "sans-serif bold italic",
+    KEYWORD_MATHBF: "bold",
+    KEYWORD_TEXTBF: "bold",
+    KEYWORD_MATHBI: "bold italic",
+    KEYWORD_TEXTIT: "italic",
+    KEYWORD_TEXTTT: "monospace"}
+
+def index(style):
+    """Returns `(main, extra)` character → styled character dictionaries.
+
+    `main` characters are computed from the offsets of `STYLES` and `extra`
+    holds the `EXCEPTIONS` of the style.
+    """
+
+    main = {}
+    extra = EXCEPTIONS.get(style, {})
+    for chars, start in zip([LATIN, GREEK, DIGITS], STYLES[style]):
+        if start is not None:
+            for offset, char in enumerate(chars):
+                if char not in extra:
+                    main[char] = chr(start + offset)
+    return main, extra
+
+# First keyword of every style (used by `KEYWORD_FONTS` suggestions)
+STYLE_KEYWORDS = {
+    style: keyword for keyword, style in reversed(KEYWORD_STYLES.items())}
+
+KEYWORDS = [*KEYWORD_STYLES, KEYWORD_FONTS]
+
+LOOKAHEAD = 0 # fonts map single characters
+
+_compiled = {}
+
+def _compile(style):
+    """Compiles a style into a `core.Automaton` (on first use)."""
+
+    compiled = _compiled.get(style)
+    if compiled is None:
+        main, extra = index(style)
+        compiled = core.Automaton({**extra, **main})
+        _compiled[style] = compiled
+    return compiled
+
+def construct_outputs(user_input):
+    """Converts `user_input` string to every style.
+
+    Returns a list of `[style, target]` pairs (in order of `STYLES`).
+    All styles are compiled once (see `_compile`), so a preview costs one
+    `str.translate` per style.
+    """
+
+    return [
+        [style, _compile(style).convert(user_input)] for style in STYLES]
+
+def construct_output(user_input, prev_target):
+    """Converts `user_input` string to output string and it's description."""
+
+    target = ""
+    short_desc = ""
+    if prev_target in KEYWORD_STYLES:
+        target, short_desc = _process(
+            user_input, _compile(KEYWORD_STYLES[prev_target]))
+    return target, short_desc
+
+def _process(user_input, compiled):
+    """Processes `user_input` string.
+
+    `compiled` is a font compiled with `_compile`.
+    """
+
+    target = compiled.convert(user_input)
+    short_desc = target
+    return target, short_desc
+
+def tokens(user_input, start, prev_target):
+    """Yields `(end, piece)` pairs of `user_input` converted from `start`
+    (see `core.Automaton.tokens`)."""
+
+    compiled = _compile(KEYWORD_STYLES[prev_target])
+    return compiled.tokens(user_input, start)
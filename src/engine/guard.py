@@ -0,0 +1,62 @@
+"""Size guardrails of generated layouts.
+
+Matrices, tables, fractions, directory trees and roman numbers are
+generated from a few numbers, so a small input (e.g. `\\table 99999,99999`)
+may require gigabytes of memory. The limits are read from the `[limits]`
+section of the package configuration and checked (with an estimated output
+size) before anything is built.
+"""
+
+DEFAULTS = {
+    "matrix_max_rows": 200,
+    "matrix_max_cols": 200,
+    "matrix_max_bytes": 1048576,
+    "table_max_rows": 1000,
+    "table_max_cols": 100,
+    "table_max_width": 200,
+    "table_max_bytes": 1048576,
+    "frac_max_length": 1000,
+    "dirtree_max_entries": 10000,
+    "dirtree_max_depth": 100,
+    "dirtree_max_bytes": 1048576,
+    "roman_max_digits": 7}
+
+def read(settings):
+    """Reads the limits from the `[limits]` section of `settings`."""
+
+    return {
+        key: settings.get_int(key, "limits", default, min=1)
+        for key, default in DEFAULTS.items()}
+
+def check(limits, category, checks, nbytes):
+    """Returns an error message if a limit is exceeded (or an empty string).
+
+    `checks` is a list of `[name, value, description]` entries, where `value`
+    is checked against the `<category>_max_<name>` limit. `nbytes` is the
+    estimated output size (in UTF-8 bytes) checked against the
+    `<category>_max_bytes` limit.
+    """
+
+    message = ""
+    for name, value, description in checks:
+        limit = limits.get(f"{category}_max_{name}")
+        if limit is not None and value > limit:
+            message = (
+                f"{description} exceeds the limit: {value} > {limit}. "
+                f"Estimated size: {size(nbytes)}.")
+            break
+    limit = limits.get(f"{category}_max_bytes")
+    if not message and limit is not None and nbytes > limit:
+        message = (
+            f"Estimated size exceeds the limit: "
+            f"{size(nbytes)} > {size(limit)}.")
+    return message
+
+def size(nbytes):
+    """Formats `nbytes` as a human readable size."""
+
+    for unit in ["B", "KB", "MB", "GB"]:
+        if nbytes < 1024 or unit == "GB":
+            break
+        nbytes /= 1024
+    return f"{nbytes:.0f} {unit}" if unit == "B" else f"{nbytes:.1f} {unit}"
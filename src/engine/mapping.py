@@ -0,0 +1,28 @@
+"""Indexes of mapping tables.
+
+`MAPPING_*` tables are lists of `[command, symbol]` pairs. They are kept as
+lists for readability, and every module builds dictionaries from them once
+(on import) for constant time lookups.
+"""
+
+def index(mapping):
+    """Returns a `command → symbol` dictionary of `mapping`.
+
+    If a command is mapped more than once, the first mapping is used.
+    """
+
+    result = {}
+    for command, symbol in mapping:
+        result.setdefault(command, symbol)
+    return result
+
+def reverse_index(mapping):
+    """Returns a `symbol → command` dictionary of `mapping`.
+
+    If a symbol is mapped more than once, the first mapping is used.
+    """
+
+    result = {}
+    for command, symbol in mapping:
+        result.setdefault(symbol, command)
+    return result
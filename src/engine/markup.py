@@ -0,0 +1,274 @@
+"""Markup-aware conversion of documents.
+
+Converting a whole Markdown or AsciiDoc document would also convert its code
+(e.g. `\\t`, `\\d` and `\\c` are accents, see `diacritical`) and its math,
+which is rendered by MathJax, KaTeX or Asciidoctor STEM. `Lexer` splits a
+document into prose, which is converted, and verbatim regions, which are
+copied unchanged:
+
+- Markdown: fenced code blocks (```` ``` ```` and `~~~`), display math
+  blocks (a line starting with `$$`), code spans, math spans (`$...$` and
+  `$$...$$`) and backslash escapes (e.g. `\\_`).
+- AsciiDoc: listing, literal, passthrough and comment blocks (`----`,
+  `....`, `++++` and `////`), fenced code blocks, comment lines, monospace
+  and passthrough text (`` `...` `` and `+...+`), `stem:[...]`,
+  `latexmath:[...]`, `asciimath:[...]` and `pass:[...]` macros and
+  backslash escapes.
+
+Spans end on the line they start on, indented code blocks and blocks nested
+in lists or quotes aren't recognized.
+
+The lexer is a single-pass state machine: blocks are found with one regular
+expression per state. The delimiter runs of a line (e.g. ``` `` ``` or
+`+`) are found by one scan of the line per character, so a span of any run
+length is closed by a lookup (see `_runs`), and the ends of the other spans
+are searched at most once per line (failed searches are remembered). Every
+character is thus scanned a bounded number of times: conversion stays
+linear in the length of the document (up to the `bisect` lookups).
+"""
+
+import bisect
+import re
+
+from Warp import core
+
+MARKDOWN = "markdown"
+ASCIIDOC = "asciidoc"
+
+SYNTAXES = [MARKDOWN, ASCIIDOC]
+
+# File extensions → syntax (see `Warp.cli`)
+EXTENSIONS = {
+    ".md": MARKDOWN,
+    ".markdown": MARKDOWN,
+    ".adoc": ASCIIDOC,
+    ".asciidoc": ASCIIDOC,
+    ".asc": ASCIIDOC}
+
+_ESCAPE = r"(?<=\\)[!-/:-@\[-`{-~]" # after `\\`, ASCII punctuation
+
+_BLOCKS = {
+    MARKDOWN: re.compile(
+        r"^ {0,3}(?:(?P<fence>`{3,}(?=[^`\n]*$)|~{3,})"
+        r"|(?P<math>\$\$)(?!.*\$\$)).*\n?",
+        re.MULTILINE),
+    ASCIIDOC: re.compile(
+        r"^(?:(?P<delimited>([-.+/])\2{3,})[ \t\r]*$"
+        r"|(?P<fence>`{3,})|//(?!//)).*\n?",
+        re.MULTILINE)}
+
+# Beginnings of spans: every alternative starts with a character of the
+# leading class (searched much faster by `re`) and is told by it
+_SPANS = {
+    MARKDOWN: re.compile(
+        r"[\\`$](?:" + _ESCAPE + r"|(?<=`)`*|(?<=\$)(?:\$|(?=[^\s$])))"),
+    ASCIIDOC: re.compile(
+        r"[\\`+:](?:" + _ESCAPE + r"|(?<=`)`*|(?<=\+)\+*"
+        r"|(?:(?<=\b(stem|pass):)|(?<=\b(latexmath|asciimath):))\[)")}
+
+_MATH_CLOSING = re.compile(r"^(?:.*\$\$.*\n?|[ \t\r]*\n)", re.MULTILINE)
+_MATH_END = re.compile(r"(?<=[^\s\\])\$(?!\d)")
+_DISPLAY_MATH_END = re.compile(r"\$\$")
+_MACRO_END = re.compile(r"(?<!\\)\]")
+_RUNS = {char: re.compile(re.escape(char) + "+") for char in "`+"}
+
+_patterns = {}
+
+def _pattern(expression, flags=0):
+    """Returns compiled `expression` (compiled once)."""
+
+    key = (expression, flags)
+    if key not in _patterns:
+        _patterns[key] = re.compile(expression, flags)
+    return _patterns[key]
+
+def _closing(match):
+    """Returns the pattern of the line closing the block opened by `match`
+    (`None` if the block is the line itself)."""
+
+    groups = match.groupdict()
+    if groups.get("fence"):
+        fence = groups["fence"]
+        return _pattern(
+            rf"^ {{0,3}}{re.escape(fence[0])}{{{len(fence)},}}[ \t\r]*$\n?",
+            re.MULTILINE)
+    if groups.get("delimited"):
+        return _pattern(
+            rf"^{re.escape(groups['delimited'])}[ \t\r]*$\n?", re.MULTILINE)
+    if groups.get("math"):
+        # Display math also ends with its paragraph
+        return _MATH_CLOSING
+    return None
+
+def _start(match):
+    """Returns the start of the span begun by `match` (a macro begins with
+    its name)."""
+
+    if match.group()[0] != ":":
+        return match.start()
+    return match.start() - len(match.group(1) or match.group(2))
+
+def _runs(text, pos, end, char):
+    """Returns the runs of `char` (e.g. backticks) of `text` from `pos` to
+    `end`: a `length → [start, ...]` dictionary (sorted starts)."""
+
+    runs = {}
+    for match in _RUNS[char].finditer(text, pos, end):
+        runs.setdefault(len(match.group()), []).append(match.start())
+    return runs
+
+def _end(match):
+    """Returns the pattern of the end of the span begun by `match` (a math
+    span or a macro, see `_runs` for the others)."""
+
+    marker = match.group()
+    if marker[0] == "$":
+        return _DISPLAY_MATH_END if marker == "$$" else _MATH_END
+    return _MACRO_END
+
+class Lexer:
+    """Lexer of a document in `syntax` (see `SYNTAXES`).
+
+    `feed(text)` and `close()` return iterators of `(prose, region)` pairs,
+    where `prose` tells whether `region` is converted. Text is lexed in
+    whole lines, so the end of a line is kept until the next call (or
+    `close`).
+    """
+
+    def __init__(self, syntax):
+        self._blocks = _BLOCKS[syntax]
+        self._spans = _SPANS[syntax]
+        self._closing = None # the pattern closing the current block
+        self._rest = ""
+
+    def feed(self, text):
+        """Lexes the lines of `text` appended to the previous one."""
+
+        text = self._rest + text
+        cut = text.rfind("\n") + 1
+        if not cut and len(text) > core.MAX_CARRY:
+            cut = len(text)
+        self._rest = text[cut:]
+        return self._regions(text, cut)
+
+    def close(self):
+        """Lexes the rest of the document."""
+
+        rest = self._rest
+        self._rest = ""
+        return self._regions(rest, len(rest))
+
+    def _regions(self, text, end):
+        """Yields the regions of `text` up to `end`."""
+
+        pos = 0
+        while pos < end:
+            if self._closing is None:
+                match = self._blocks.search(text, pos, end)
+                yield from self._inline(
+                    text, pos, match.start() if match else end)
+                if not match:
+                    return
+                yield False, match.group()
+                self._closing = _closing(match)
+                pos = match.end()
+            else:
+                match = self._closing.search(text, pos, end)
+                stop = match.end() if match else end
+                yield False, text[pos:stop]
+                if match:
+                    self._closing = None
+                pos = stop
+
+    def _inline(self, text, pos, end):
+        """Yields the regions of `text` from `pos` to `end` (outside
+        blocks)."""
+
+        prose = pos
+        failed = {} # pattern → end of the line where it wasn't found
+        lines = {} # character → [end of the line, its runs (see `_runs`)]
+        while True:
+            match = self._spans.search(text, pos, end)
+            if not match:
+                break
+            marker = match.group()
+            stop = None
+            if marker[0] == "\\":
+                stop = match.end() # an escape
+            else:
+                line_end = text.find("\n", match.end(), end)
+                if line_end < 0:
+                    line_end = end
+                if marker[0] in _RUNS:
+                    # The runs of the line are found once, the next
+                    # markers of the line are after the first one
+                    if lines.get(marker[0], [None])[0] != line_end:
+                        lines[marker[0]] = [line_end, _runs(
+                            text, match.end(), line_end, marker[0])]
+                    starts = lines[marker[0]][1].get(len(marker), [])
+                    i = bisect.bisect_left(starts, match.end())
+                    if i < len(starts):
+                        stop = starts[i] + len(marker)
+                else:
+                    pattern = _end(match)
+                    if failed.get(pattern) != line_end:
+                        found = pattern.search(text, match.end(), line_end)
+                        if found:
+                            stop = found.end()
+                        else:
+                            failed[pattern] = line_end
+            if stop is None:
+                # Not a span, its beginning is prose
+                pos = match.end()
+                continue
+            start = _start(match)
+            if start > prose:
+                yield True, text[prose:start]
+            yield False, text[start:stop]
+            prose = pos = stop
+        if end > prose:
+            yield True, text[prose:end]
+
+def convert(text, syntax, function):
+    """Converts the prose of `text` document with `function(text)`."""
+
+    lexer = Lexer(syntax)
+    pieces = []
+    prose = []
+    for regions in [lexer.feed(text), lexer.close()]:
+        for is_prose, region in regions:
+            if is_prose:
+                prose.append(region)
+                continue
+            if prose:
+                pieces.append(function("".join(prose)))
+                prose = []
+            pieces.append(region)
+    if prose:
+        pieces.append(function("".join(prose)))
+    return "".join(pieces)
+
+def stream(chunks, syntax, tokenize, lookahead=0):
+    """Converts the prose of a document read in `chunks`, yielding the
+    output in pieces (see `core.stream`).
+
+    The prose between two verbatim regions is converted as one text, so the
+    output doesn't depend on how the document is split into chunks.
+    """
+
+    lexer = Lexer(syntax)
+    converter = core.Stream(tokenize, lookahead)
+
+    def convert_regions(regions):
+        pieces = []
+        for prose, region in regions:
+            if prose:
+                pieces.append(converter.feed(region))
+            else:
+                pieces.append(converter.close())
+                pieces.append(region)
+        return "".join(pieces)
+
+    for chunk in chunks:
+        yield convert_regions(lexer.feed(chunk))
+    yield convert_regions(lexer.close()) + converter.close()
@@ -0,0 +1,118 @@
+"""Math operations with complex commands.
+
+Math commands with required fields (fractions, roots).
+"""
+
+import re
+
+from Warp import core
+from Warp.engine import base
+from Warp.engine import guard
+from Warp.engine import mapping
+
+KEYWORD_FRAC = "\\frac"
+KEYWORD_FFRAC = "\\Frac" # Additional: full (3-lines) expressions
+KEYWORD_ROOT = "\\sqrt"
+
+MAPPING_FRAC = [
+    ["{1}{2}", "½"],
+    ["{1}{4}", "¼"],
+    ["{3}{4}", "¾"],
+    ["{1}{7}", "⅐"],
+    ["{1}{9}", "⅑"],
+    ["{1}{10}", "⅒"],
+    ["{1}{3}", "⅓"],
+    ["{2}{3}", "⅔"],
+    ["{1}{5}", "⅕"],
+    ["{2}{5}", "⅖"],
+    ["{3}{5}", "⅗"],
+    ["{4}{5}", "⅘"],
+    ["{1}{6}", "⅙"],
+    ["{5}{6}", "⅚"],
+    ["{1}{8}", "⅛"],
+    ["{3}{8}", "⅜"],
+    ["{5}{8}", "⅝"],
+    ["{7}{8}", "⅞"],
+    ["{1}", "⅟"],
+    ["{0}{3}", "↉"],
+    ["{a}{c}", "℀"],
+    ["{a}{s}", "℁"],
+    ["{c}{u}", "℆"],
+    ["{c}{o}", "℅"],
+    ["{A}{S}", "⅍"]]
+
+MAPPING_ROOT = [
+    ["[2]", "√"],
+    ["[3]", "∛"],
+    ["[4]", "∜"]]
+
+INDEX_FRAC = mapping.index(MAPPING_FRAC)
+INDEX_ROOT = mapping.index(MAPPING_ROOT)
+
+KEYWORDS = [KEYWORD_FRAC, KEYWORD_FFRAC, KEYWORD_ROOT]
+
+def construct_frac(user_input):
+    """Constructs a fraction consisted of superscript and subscript symbols.
+    
+    `user_input` must be in form of `{x}{y}` where `x` and `y` are arbitary
+    values.
+    """
+
+    target = ""
+
+    pattern = r"{(.*)}{(.*)}"
+    match = re.match(pattern, user_input)
+    if match and user_input.count("{") == 2 and user_input.count("}") == 2:
+        numerator = match.group(1)
+        denominator = match.group(2)
+
+        target = (
+            base.COMPILED_SUPERSCRIPT.convert(numerator, core.DROP) + "⁄" +
+            base.COMPILED_SUBSCRIPT.convert(denominator, core.DROP))
+    
+    return target
+
+def construct_ffrac(user_input, rendering=True, limits=None):
+    """Constructs a fraction consisted of three lines (numerator, line and denominator).
+    
+    `user_input` must be a string with a positive integer - length of the
+    fraction's line (without two boundary signs).
+    If `rendering` is set to `False`, `user_input` is only validated and the
+    output string is empty (unless there is an error).
+    If `limits` are specified, the length is checked against them (see
+    `guard`).
+    """
+
+    target = ""
+    short_desc = ""
+    error_indicator = False
+
+    if not user_input.isdigit():
+        error_indicator = True
+        target = (
+            f"Length of the fraction must be a positive integer. "
+            f"Wrong value: {user_input}")
+    if not error_indicator and int(user_input) < 1:
+        error_indicator = True
+        target = (
+            f"Length of the fraction must be ≥ 1. "
+            f"Wrong value: {user_input}")
+    if not error_indicator and limits:
+        # Two lines of spaces and a line of `―` (3 bytes each)
+        length = int(user_input)
+        target = guard.check(
+            limits,
+            "frac",
+            [["length", length, "Length of the fraction"]],
+            5 * (length + 2) + 3)
+        error_indicator = len(target) > 0
+    if not error_indicator:
+        length = int(user_input)
+        if rendering:
+            target = (
+                " " + " " * length + " \n" +
+                "―" + "―" * length + "―\n" +
+                " " + " " * length + " \n")
+        short_desc = f"Frac [{length}]"
+
+    return target, short_desc, error_indicator
@@ -0,0 +1,125 @@
+"""Arabic-Roman numbers converter.
+
+Converts arabic numbers to roman numbers (BibTeX-style commands).
+"""
+
+from Warp.engine import guard
+from Warp.engine import mapping
+
+KEYWORD_ROMAN_CAPITAL = "\\RN"
+KEYWORD_ROMAN_SMALL = "\\Rn"
+
+MAPPING_ROMAN_CAPITAL = [
+    ["1", "Ⅰ"],
+    ["2", "Ⅱ"],
+    ["3", "Ⅲ"],
+    ["4", "Ⅳ"],
+    ["5", "Ⅴ"],
+    ["6", "Ⅵ"],
+    ["7", "Ⅶ"],
+    ["8", "Ⅷ"],
+    ["9", "Ⅸ"],
+    ["10", "Ⅹ"],
+    ["11", "Ⅺ"],
+    ["12", "Ⅻ"],
+    ["50", "Ⅼ"],
+    ["100", "Ⅽ"],
+    ["500", "Ⅾ"],
+    ["1000", "Ⅿ"]]
+
+MAPPING_ROMAN_SMALL = [
+    ["1", "ⅰ"],
+    ["2", "ⅱ"],
+    ["3", "ⅲ"],
+    ["4", "ⅳ"],
+    ["5", "ⅴ"],
+    ["6", "ⅵ"],
+    ["7", "ⅶ"],
+    ["8", "ⅷ"],
+    ["9", "ⅸ"],
+    ["10", "ⅹ"],
+    ["11", "ⅺ"],
+    ["12", "ⅻ"],
+    ["50", "ⅼ"],
+    ["100", "ⅽ"],
+    ["500", "ⅾ"],
+    ["1000", "ⅿ"]]
+
+INDEX_ROMAN_CAPITAL = mapping.index(MAPPING_ROMAN_CAPITAL)
+INDEX_ROMAN_SMALL = mapping.index(MAPPING_ROMAN_SMALL)
+
+KEYWORDS = [KEYWORD_ROMAN_CAPITAL, KEYWORD_ROMAN_SMALL]
+
+def construct_output(user_input, prev_target, limits=None):
+    """Converts `user_input` string to output string.
+
+    If `limits` are specified, the number of digits is checked against them
+    (see `guard`).
+    """
+
+    output = ""
+    error_indicator = False
+
+    if not user_input.isdigit():
+        error_indicator = True
+        output = (
+            f"Converts only arabic numres into roman numbers. "
+            f"Wrong input: {user_input}")
+    if not error_indicator and limits:
+        # Thousands are repeated `Ⅿ` (3 bytes each), so the output grows with
+        # the number (estimated as at least 10¹⁸ thousands if it is longer)
+        digits = user_input.lstrip("0")
+        thousands = int(digits[:-3] or "0") if len(digits) <= 21 else 10**18
+        output = guard.check(
+            limits,
+            "roman",
+            [["digits", len(digits), "Number of digits"]],
+            3 * (thousands + 12))
+        error_indicator = len(output) > 0
+    if not error_indicator and int(user_input) < 1:
+        error_indicator = True
+        output = (
+            f"Arabic number must be a positive integer. "
+            f"Wrong input: {user_input}")
+
+    if not error_indicator and prev_target == KEYWORD_ROMAN_CAPITAL:
+        output = _arabic_to_roman(user_input, INDEX_ROMAN_CAPITAL)
+    elif not error_indicator and prev_target == KEYWORD_ROMAN_SMALL:
+        output = _arabic_to_roman(user_input, INDEX_ROMAN_SMALL)
+
+    return output, error_indicator
+
+def _arabic_to_roman(user_input, index):
+    """Converts arabic number to a roman number."""
+
+    output = ""
+    residual = int(user_input)
+    for roman_base in [1000, 100, 10, 1]:
+        residual, roman_occurences = _conversion_step(
+            index, residual, roman_base)
+        output += roman_occurences
+    return output
+
+def _conversion_step(index, residual, roman_base):
+    """Conversion step for roman number base."""
+
+    roman_number = ""
+    number_of_occurrences = residual // roman_base
+    residual -= roman_base * number_of_occurrences
+    roman_single = index[str(roman_base)]
+    if number_of_occurrences == 4:
+        current_base = index[str(roman_base * 5)]
+        lesser_base = index[str(roman_base)]
+        roman_occurences = lesser_base + current_base
+    elif number_of_occurrences >= 5 and number_of_occurrences < 9:
+        current_base = index[str(roman_base * 5)]
+        lesser_base = index[str(roman_base)]
+        roman_occurences = (
+            current_base + lesser_base * (number_of_occurrences - 5))
+    elif number_of_occurrences == 9:
+        current_base = index[str(roman_base * 10)]
+        lesser_base = index[str(roman_base)]
+        roman_occurences = lesser_base + current_base
+    else:
+        roman_occurences = roman_single * number_of_occurrences
+    return residual, roman_occurences
@@ -0,0 +1,217 @@
+"""Search of the main entries by their commands.
+
+Keypirinha matches every main entry (several hundreds of symbols and
+commands) against `user_input` on each keystroke. `Index` finds the
+candidates itself, so the work depends on the number of matches rather than
+on the number of entries. Mistyped commands (e.g. `\\alpah`, `\\lamda`) are
+found with a precomputed index of deletions (as in SymSpell). Symbols can
+also be found by meaning (e.g. `not equal`, `arrow`) with an inverted index of
+the words describing them.
+
+The same index of the symbols answers `engine.suggest` (e.g. for editors).
+"""
+
+import bisect
+import re
+import unicodedata
+
+EXACT = 0
+PREFIX = 1
+SUBSTRING = 2
+WORDS = 3
+TYPO = 4
+
+MAX_DISTANCE = 2 # edits of a mistyped command
+MIN_WORD_PREFIX = 2 # characters of the last word of a query to complete it
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+def normalize(command):
+    """Returns the search key of `command` (e.g. `\\Alpha` → `alpha`)."""
+
+    return command.lstrip("\\").lower()
+
+def words(text):
+    """Returns the set of search words of `text`.
+
+    These are the lowercase alphanumeric words of `text` and of the Unicode
+    names of its non-ASCII characters (e.g. `≠` → `not`, `equal`, `to`).
+    """
+
+    names = [unicodedata.name(c, "") for c in set(text) if not c.isascii()]
+    return set(_WORD.findall(" ".join([text, *names]).lower()))
+
+def deletes(key, max_distance):
+    """Returns the strings made of `key` by deleting up to `max_distance`
+    characters (including `key` itself)."""
+
+    result = {key}
+    edge = {key}
+    for _ in range(max_distance):
+        edge = {s[:i] + s[i+1:] for s in edge for i in range(len(s))}
+        result |= edge
+    return result
+
+def distance(a, b):
+    """Returns the edit distance between `a` and `b`.
+
+    Insertions, deletions, substitutions and transpositions of two adjacent
+    characters count as one edit (optimal string alignment distance).
+    """
+
+    before = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j-1] + 1,
+                previous[j-1] + (a[i-1] != b[j-1]))
+            if i > 1 and j > 1 and a[i-1] == b[j-2] and a[i-2] == b[j-1]:
+                current[j] = min(current[j], before[j-2] + 1)
+        before, previous = previous, current
+    return previous[-1]
+
+def max_distance(key):
+    """Returns the number of edits allowed for a query `key`.
+
+    Short queries are mostly incomplete rather than mistyped (e.g. `pi` is
+    within two edits of almost every short command).
+    """
+
+    return min(MAX_DISTANCE, len(key) // 2)
+
+class Index:
+    """Index of values by their commands.
+
+    Commands are normalized (see `normalize`) and sorted, so the commands
+    starting with a query are a range found with `bisect`. Substrings are
+    found with `str.find` over all the commands joined into one string.
+    Every command is also indexed by its `deletes`: a command within
+    `MAX_DISTANCE` edits of a query shares a deletion with it, so only these
+    candidates are compared with `distance`.
+    Finally, the `words` of the commands and of their descriptions are
+    indexed by an inverted index: every word has a sorted list of commands
+    (a posting list), and a query of several words intersects them.
+    """
+
+    def __init__(self, entries):
+        """`entries` is a list of `[command, value]` or
+        `[command, value, description]` lists."""
+
+        order = sorted(
+            range(len(entries)), key=lambda i: normalize(entries[i][0]))
+        self._keys = [normalize(entries[i][0]) for i in order]
+        self._commands = [entries[i][0] for i in order]
+        self._values = [entries[i][1] for i in order]
+        self._order = order # position of the entry in `entries`
+        # Commands joined by line breaks and their offsets in `_text`
+        self._text = "\n".join(self._keys)
+        self._starts = []
+        start = 0
+        for key in self._keys:
+            self._starts.append(start)
+            start += len(key) + 1
+        self._longest = max(map(len, self._keys), default=0)
+        self._deletes = {}
+        for i, key in enumerate(self._keys):
+            for deleted in deletes(key, MAX_DISTANCE):
+                self._deletes.setdefault(deleted, []).append(i)
+        postings = {}
+        for i, entry in enumerate(entries[j] for j in order):
+            for word in words(" ".join([entry[0], *entry[2:]])):
+                postings.setdefault(word, []).append(i)
+        self._vocabulary = sorted(postings)
+        self._postings = [postings[word] for word in self._vocabulary]
+
+    def __len__(self):
+        return len(self._keys)
+
+    def search(self, query):
+        """Returns the values matching `query`, the best ones first.
+
+        Exact matches come first, then the commands starting with `query`,
+        then the commands containing it, then the commands described by all
+        the words of it (the last one may be incomplete), then the commands
+        within a few edits of it (nearest first, see `max_distance`). Within
+        a group, commands typed with the same case as `query` (or at least
+        starting with the same letter case) and shorter commands come first.
+        An empty query (e.g. `\\`) matches all the values (in order of
+        entries).
+        """
+
+        return [self._values[i] for i in self._ranked(query)]
+
+    def _described(self, query):
+        """Returns the positions of the commands described by `query`.
+
+        Every word of `query` must be a search word of the command, except
+        the last one, which may also be a prefix of a search word (at least
+        `MIN_WORD_PREFIX` characters long).
+        """
+
+        query_words = _WORD.findall(query.lower())
+        if not query_words:
+            return []
+        lists = []
+        for n, word in enumerate(query_words, 1):
+            lo = bisect.bisect_left(self._vocabulary, word)
+            if n < len(query_words) or len(word) < MIN_WORD_PREFIX:
+                hi = lo + (self._vocabulary[lo:lo+1] == [word])
+            else:
+                hi = bisect.bisect_right(
+                    self._vocabulary, word + "\U0010ffff", lo)
+            if hi - lo == 1:
+                lists.append(self._postings[lo])
+            else:
+                # Union of the words completing the last one
+                lists.append(sorted({
+                    i for postings in self._postings[lo:hi]
+                    for i in postings}))
+        lists.sort(key=len)
+        result = set(lists[0])
+        for postings in lists[1:]:
+            result.intersection_update(postings)
+        return result
+
+    def _ranked(self, query):
+        """Returns the positions of the matching commands, ranked."""
+
+        key = normalize(query)
+        if not key:
+            return sorted(range(len(self._keys)), key=self._order.__getitem__)
+        lo = bisect.bisect_left(self._keys, key)
+        hi = bisect.bisect_right(self._keys, key + "\U0010ffff", lo)
+        matches = {
+            i: (EXACT if self._keys[i] == key else PREFIX, 0)
+            for i in range(lo, hi)}
+        if "\n" not in key:
+            pos = self._text.find(key)
+            while pos >= 0:
+                i = bisect.bisect_right(self._starts, pos) - 1
+                matches.setdefault(i, (SUBSTRING, 0))
+                # Next command (a command is reported once)
+                pos = self._text.find(
+                    key, self._starts[i] + len(self._keys[i]) + 1)
+        for i in self._described(query):
+            matches.setdefault(i, (WORDS, 0))
+        limit = max_distance(key)
+        if len(key) <= self._longest + MAX_DISTANCE:
+            # Longer queries (e.g. pasted text) are too far from every
+            # command, and their deletions are too many to look up
+            candidates = set()
+            for deleted in deletes(key, limit):
+                candidates.update(self._deletes.get(deleted, []))
+            for i in candidates.difference(matches):
+                if abs(len(self._keys[i]) - len(key)) <= limit:
+                    edits = distance(key, self._keys[i])
+                    if edits <= limit:
+                        matches[i] = (TYPO, edits)
+        typed = query.lstrip("\\")
+        return sorted(matches, key=lambda i: (
+            *matches[i],
+            not self._commands[i].lstrip("\\").startswith(typed),
+            not self._commands[i].lstrip("\\").startswith(typed[0]),
+            len(self._keys[i]),
+            self._order[i]))
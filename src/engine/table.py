@@ -0,0 +1,76 @@
+"""Markdown-style table.
+
+Converts specified dimensions (and width of the columns) to an empty
+Markdown-style table.
+"""
+
+from Warp.engine import guard
+
+KEYWORD_TABLE = "\\table" # Markdown-style
+
+KEYWORDS = [KEYWORD_TABLE]
+
+def construct_output(user_input, rendering=True, limits=None):
+    """Converts `user_input` string to output string and returns some meta.
+
+    If `rendering` is set to `False`, `user_input` is only validated and the
+    output string is empty (unless there is an error).
+    If `limits` are specified, the attributes are checked against them (see
+    `guard`).
+    """
+
+    output = ""
+    short_desc = ""
+    error_indicator = False
+
+    attrs = user_input.split(',')
+
+    if not len(attrs) in [2, 3]:
+        error_indicator = True
+        output = (
+            f"Number of attributes must be 2 or 3. "
+            f"Wrong value: {user_input}")
+    if not error_indicator and False in [a.isdigit() for a in attrs]:
+        error_indicator = True
+        output = (
+            f"All attributes must be a positive integer. "
+            f"Wrong value: {user_input}")
+    if not error_indicator and True in [int(a) < 1 for a in attrs]:
+        error_indicator = True
+        output = (
+            f"All attributes must be ≥ 1. "
+            f"Wrong value: {user_input}")
+
+    if not error_indicator:
+        nrows = 1
+        ncols = 3
+        width = 10
+
+        if len(attrs) == 2:
+            nrows = int(attrs[0])
+            ncols = int(attrs[1])
+        elif len(attrs) == 3:
+            nrows = int(attrs[0])
+            ncols = int(attrs[1])
+            width = int(attrs[2])
+        if limits:
+            # `nrows + 2` lines of `ncols` ASCII cells and a border
+            output = guard.check(
+                limits,
+                "table",
+                [
+                    ["rows", nrows, "Number of rows"],
+                    ["cols", ncols, "Number of columns"],
+                    ["width", width, "Width of the columns"]],
+                (nrows + 2) * (ncols * (width + 3) + 2))
+            error_indicator = len(output) > 0
+        if rendering and not error_indicator:
+            output = ((
+                "| " + " " * width + " ") * ncols + "|\n" + (
+                "| " + "-" * width + " ") * ncols + "|\n" + ((
+                "| " + " " * width + " ") * ncols + "|\n") * nrows)
+        if not error_indicator:
+            short_desc = (
+                f"table [rows: {nrows}, cols: {ncols}, width: {width}]")
+    
+    return output, short_desc, error_indicator
@@ -0,0 +1,156 @@
+"""Unicode to LaTeX-like commands (reverse conversion).
+
+Converts Unicode text (e.g. produced by Warp) back to LaTeX-like commands:
+symbols, fractions, superscripts and subscripts, math fonts, roman numbers
+and diacritical symbols. Other characters are left unchanged.
+"""
+
+import re
+
+from Warp import core
+from Warp.engine import base
+from Warp.engine import diacritical
+from Warp.engine import fonts
+from Warp.engine import operations
+from Warp.engine import roman
+from Warp.engine import symbols
+
+KEYWORD_UNWARP = "\\unwarp" # additional
+
+# Kinds of characters that are not converted one by one
+SUPERSCRIPT = "superscript"
+SUBSCRIPT = "subscript"
+ACCENT = "accent"
+
+KEYWORDS = [KEYWORD_UNWARP]
+
+# Search words of the keyword (see `search`)
+TAGS = {KEYWORD_UNWARP: ["reverse", "unicode", "latex", "source"]}
+
+def _inverse():
+    """Returns a `symbol → [kind, command]` dictionary of all the tables.
+
+    Aliases (a symbol produced by several commands) are resolved by order:
+    symbols, fractions, fonts (in order of `fonts.STYLES`), superscripts,
+    subscripts, roman numbers and diacritical symbols; within a table the
+    first command wins (as in `mapping.reverse_index`). Commands whose
+    symbol is padded with spaces (e.g. `\\unlhd` → `⊴ `) are used only if
+    no command produces the symbol alone. Symbols that are plain ASCII
+    (e.g. `\\ast` → `*`) are left unchanged.
+    """
+
+    tables = [[None, symbols.MAPPING_SYMBOLS]]
+    tables.append([None, [
+        [operations.KEYWORD_FRAC + fraction, symbol]
+        for fraction, symbol in operations.MAPPING_FRAC
+        if fraction.count("{") == 2]])
+    for style in fonts.STYLES:
+        main, extra = fonts.index(style)
+        tables.append([style, [
+            [symbols.REVERSE_SYMBOLS.get(char, char), glyph]
+            for char, glyph in [*main.items(), *extra.items()]]])
+    tables.extend([
+        [SUPERSCRIPT, base.MAPPING_SUPERSCRIPT],
+        [SUBSCRIPT, base.MAPPING_SUBSCRIPT],
+        [roman.KEYWORD_ROMAN_CAPITAL, roman.MAPPING_ROMAN_CAPITAL],
+        [roman.KEYWORD_ROMAN_SMALL, roman.MAPPING_ROMAN_SMALL],
+        [ACCENT, diacritical.MAPPING_DIACRITICAL]])
+
+    result = {}
+    padded = {}
+    for kind, table in tables:
+        for command, symbol in table:
+            glyph = symbol.strip()
+            if glyph and not glyph.isascii() and glyph != command:
+                aliases = result if symbol == glyph else padded
+                aliases.setdefault(glyph, [kind, command])
+    for glyph, entry in padded.items():
+        result.setdefault(glyph, entry)
+    return result
+
+COMPILED_INVERSE = core.Automaton(_inverse())
+
+_LETTER_COMMAND = re.compile(r"\\[A-Za-z]+$")
+
+def _join(sources):
+    """Joins `sources`, separating a command from a letter after it."""
+
+    pieces = []
+    previous = ""
+    for source in sources:
+        if (source[:1].isalpha() and previous[-1:].isalpha()
+                and _LETTER_COMMAND.search(previous)):
+            pieces.append(" ")
+        pieces.append(source)
+        previous = source
+    return "".join(pieces)
+
+def _roman_to_arabic(numerals):
+    """Returns the value of roman `numerals` (as `[value, ...]` strings)."""
+
+    values = [int(value) for value in numerals]
+    total = 0
+    for value, following in zip(values, [*values[1:], 0]):
+        total += -value if value < following else value
+    return total
+
+def _group(kind, sources):
+    """Returns LaTeX-like command for a run of `sources` of the same kind."""
+
+    if kind == SUPERSCRIPT:
+        return f"{base.KEYWORD_SUPERSCRIPT}{{{_join(sources)}}}"
+    if kind == SUBSCRIPT:
+        return f"{base.KEYWORD_SUBSCRIPT}{{{_join(sources)}}}"
+    if kind in [roman.KEYWORD_ROMAN_CAPITAL, roman.KEYWORD_ROMAN_SMALL]:
+        return f"{kind}{{{_roman_to_arabic(sources)}}}"
+    return f"{fonts.STYLE_KEYWORDS[kind]}{{{_join(sources)}}}"
+
+def construct_output(user_input):
+    """Converts `user_input` string to LaTeX-like commands.
+
+    `user_input` is scanned once: every symbol is replaced by its command,
+    combining marks wrap the preceding symbol (e.g. `x̂` → `\\hat{x}`) and
+    runs of symbols of the same kind (superscripts, a font, ...) are
+    grouped (e.g. `𝐯𝐞𝐜` → `\\mathbf{vec}`).
+    """
+
+    tokens = [] # `[kind, source]` lists
+    text = None # position in `tokens` of the last unchanged text
+    pos = 0
+    for begin, end, [kind, command] in COMPILED_INVERSE.finditer(user_input):
+        if begin > pos:
+            text = len(tokens)
+            tokens.append([None, user_input[pos:begin]])
+        pos = end
+        if kind == ACCENT:
+            if not tokens:
+                # Nothing to mark, the mark is left unchanged
+                text = len(tokens)
+                tokens.append([None, user_input[begin:end]])
+                continue
+            if text == len(tokens) - 1 and len(tokens[-1][1]) > 1:
+                # Only the last character of unchanged text is marked
+                unchanged = tokens[-1][1]
+                tokens[-1][1] = unchanged[:-1]
+                tokens.append([None, unchanged[-1]])
+            elif tokens[-1][0] in roman.KEYWORDS:
+                # A numeral can't be marked inside of a number
+                numeral_kind, numeral = tokens[-1]
+                tokens[-1] = [None, _group(numeral_kind, [numeral])]
+            # A marked symbol (or marked text) is marked as a whole again
+            tokens[-1][1] = f"{command}{{{tokens[-1][1]}}}"
+            text = None
+        else:
+            tokens.append([kind, command])
+    if pos < len(user_input):
+        tokens.append([None, user_input[pos:]])
+
+    sources = []
+    start = 0
+    for end in range(1, len(tokens) + 1):
+        kind = tokens[start][0]
+        if end == len(tokens) or tokens[end][0] != kind or kind is None:
+            run = [source for _, source in tokens[start:end]]
+            sources.append(run[0] if kind is None else _group(kind, run))
+            start = end
+    return _join(sources)
@@ -4,15 +4,10 @@ import keypirinha as kp
 import keypirinha_util as kpu
 import keypirinha_net as kpnet
 
-from Warp.cat import base
-from Warp.cat import symbols
-from Warp.cat import operations
-from Warp.cat import diacritical
-from Warp.cat import fonts
-from Warp.cat import roman
-from Warp.cat import matrix
-from Warp.cat import table
-from Warp.cat import dirtree
+from Warp import cat
+from Warp.cat import cache
+from Warp.engine import search
+from Warp.engine import guard
 
 class Warp(kp.Plugin):
     """
@@ -37,21 +32,17 @@ class Warp(kp.Plugin):
 
     KEYWORD_PLUGIN = "$"
 
-    CATEGORY_BASE = kp.ItemCategory.USER_BASE + 1
-    CATEGORY_SYMBOLS = kp.ItemCategory.USER_BASE + 2
-    CATEGORY_OPERATIONS = kp.ItemCategory.USER_BASE + 3
-    CATEGORY_DIACRITICAL = kp.ItemCategory.USER_BASE + 4
-    CATEGORY_FONTS = kp.ItemCategory.USER_BASE + 5
-    CATEGORY_ROMAN = kp.ItemCategory.USER_BASE + 6
-    CATEGORY_MATRIX = kp.ItemCategory.USER_BASE + 7
-    CATEGORY_TABLE = kp.ItemCategory.USER_BASE + 8
-    CATEGORY_DIRTREE = kp.ItemCategory.USER_BASE + 9
+    DEFAULT_CACHE_SIZE = 256
 
     def __init__(self):
         super().__init__()
+        self._root_suggestions = None
+        self._root_index = None
+        self._cache = cache.LRUCache(self.DEFAULT_CACHE_SIZE)
+        self.limits = dict(guard.DEFAULTS)
 
     def on_start(self):
-        pass
+        self._read_config()
 
     def on_catalog(self):
         self.set_catalog([
@@ -70,47 +61,42 @@ class Warp(kp.Plugin):
         if is_keyword:
             return
             
-        suggestions = []
-
         category = items_chain[-1].category()
         target = items_chain[-1].target()
 
-        # Add suggestions
-        if category == self.CATEGORY_BASE:
-            suggestions.append(base.get_suggestions(self, user_input, target))
-        elif category == self.CATEGORY_OPERATIONS:
-            suggestions.extend(
-                operations.get_suggestions(self, user_input, target))
-        elif category == self.CATEGORY_DIACRITICAL:
-            suggestions.append(
-                diacritical.get_suggestions(self, user_input, target))
-        elif category == self.CATEGORY_FONTS:
-            suggestions.append(fonts.get_suggestions(self, user_input, target))
-        elif category == self.CATEGORY_ROMAN:
-            suggestions.append(roman.get_suggestions(self, user_input, target))
-        elif category == self.CATEGORY_MATRIX:
-            suggestions.append(matrix.get_suggestions(self, user_input, target))
-        elif category == self.CATEGORY_TABLE:
-            suggestions.append(table.get_suggestions(self, user_input))
-        elif category == self.CATEGORY_DIRTREE:
-            suggestions.append(dirtree.get_suggestions(self, user_input))
+        match_method = kp.Match.DEFAULT
+        sort_method = kp.Sort.SCORE_DESC
+        module = cat.get(category)
+        if module:
+            # Add suggestions
+            key = (category, target, user_input)
+            suggestions = self._cache.get(key)
+            if suggestions is None:
+                suggestions = module.get_suggestions(self, user_input, target)
+                if self.should_terminate():
+                    # Superseded by newer input (suggestions may be partial)
+                    return
+                self._cache.put(key, suggestions)
         else:
-            # Assign categories (main plugin entries)
-            suggestions.extend(base.assign_cat(self))
-            suggestions.extend(symbols.assign_cat(self))
-            suggestions.extend(operations.assign_cat(self))
-            suggestions.extend(diacritical.assign_cat(self))
-            suggestions.extend(fonts.assign_cat(self))
-            suggestions.extend(roman.assign_cat(self))
-            suggestions.extend(matrix.assign_cat(self))
-            suggestions.append(table.assign_cat(self))
-            suggestions.append(dirtree.assign_cat(self))
-
-        self.set_suggestions(suggestions, kp.Match.DEFAULT, kp.Sort.SCORE_DESC)
+            # Main plugin entries (built once, see `_build_root_suggestions`)
+            if self._root_suggestions is None:
+                self._build_root_suggestions()
+            suggestions = self._root_suggestions
+            if len(user_input) > 0:
+                # Already matched and ranked (see `search.Index`)
+                suggestions = self._root_index.search(user_input)
+                match_method = kp.Match.ANY
+                sort_method = kp.Sort.NONE
+
+        self.set_suggestions(suggestions, match_method, sort_method)
 
     def on_execute(self, item, action):
         if item:
-            kpu.set_clipboard(item.target())
+            if item.data_bag():
+                # Deferred or non-BMP output (see `cat.deferred`, `cat.exact`)
+                kpu.set_clipboard(cat.render(item.data_bag()))
+            else:
+                kpu.set_clipboard(item.target())
 
     def on_activated(self):
         pass
@@ -119,4 +105,44 @@ class Warp(kp.Plugin):
         pass
 
     def on_events(self, flags):
-        pass
+        if flags & kp.Events.PACKCONFIG:
+            self.dbg(
+                f"Suggestions cache: {self._cache.hits} hits, "
+                f"{self._cache.misses} misses")
+            self._read_config()
+            # Rebuilt on next use
+            self._root_suggestions = None
+            self._root_index = None
+
+    def _read_config(self):
+        """Reads the package configuration (and drops cached suggestions)."""
+
+        settings = self.load_settings()
+        cache_size = settings.get_int(
+            "cache_size", "main", self.DEFAULT_CACHE_SIZE, min=0)
+        self._cache.clear(cache_size)
+        self.limits = guard.read(settings)
+
+    def _build_root_suggestions(self):
+        """Assigns categories (main plugin entries).
+
+        The root list holds several hundreds of items and doesn't depend on
+        `user_input`, so it is built once (when first needed, which also
+        imports the category modules) and reused on every keystroke.
+        The items are also indexed by their labels (commands), descriptions
+        and tags to search them as `user_input` is typed.
+        """
+
+        suggestions = []
+        entries = []
+        for module in cat.modules():
+            items = module.assign_cat(self)
+            tags = getattr(module, "TAGS", {})
+            suggestions.extend(items)
+            entries.extend([
+                item.label(),
+                item,
+                item.short_desc(),
+                *tags.get(item.label(), [])] for item in items)
+        self._root_suggestions = suggestions
+        self._root_index = search.Index(entries)
@@ -0,0 +1,82 @@
+"""Test configuration.
+
+The package is the `src` directory imported as `Warp` (as Keypirinha does).
+Category modules import `keypirinha`, which only exists inside the
+launcher, so a minimal stand-in is installed when it is missing.
+"""
+
+import enum
+import pathlib
+import sys
+import types
+
+import pytest
+
+SRC = pathlib.Path(__file__).resolve().parent.parent / "src"
+
+def _install_package():
+    """Imports `src` as the `Warp` package."""
+
+    if "Warp" not in sys.modules:
+        package = types.ModuleType("Warp")
+        package.__path__ = [str(SRC)]
+        sys.modules["Warp"] = package
+
+def _install_keypirinha():
+    """Installs a stand-in of the `keypirinha` module."""
+
+    try:
+        import keypirinha # noqa: F401
+        return
+    except ImportError:
+        pass
+    kp = types.ModuleType("keypirinha")
+
+    class ItemCategory(enum.IntEnum):
+        KEYWORD = 2
+        USER_BASE = 1000
+
+    class ItemArgsHint(enum.IntEnum):
+        FORBIDDEN = 0
+        ACCEPTED = 1
+        REQUIRED = 2
+
+    class ItemHitHint(enum.IntEnum):
+        IGNORE = 0
+        NOARGS = 1
+        KEEPALL = 2
+
+    kp.ItemCategory = ItemCategory
+    kp.ItemArgsHint = ItemArgsHint
+    kp.ItemHitHint = ItemHitHint
+    sys.modules["keypirinha"] = kp
+
+_install_package()
+_install_keypirinha()
+
+class Item:
+    """Stand-in of `keypirinha.CatalogItem` (attributes are getters)."""
+
+    def __init__(self, **attributes):
+        self._attributes = attributes
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda: self._attributes.get(name)
+
+class Plugin:
+    """Stand-in of `keypirinha.Plugin` for category modules."""
+
+    def __init__(self, should_terminate=None):
+        self.should_terminate = should_terminate or (lambda: False)
+
+    def create_item(self, **attributes):
+        return Item(**attributes)
+
+    def create_error_item(self, **attributes):
+        return Item(**attributes)
+
+@pytest.fixture
+def plugin():
+    return Plugin()
@@ -0,0 +1,42 @@
+"""Batch conversion of trees (`cli.batch`)."""
+
+from Warp.cli import batch
+
+def _tree(root, files):
+    for name, text in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+def test_convert_tree(tmp_path):
+    source = tmp_path / "docs"
+    target = tmp_path / "out"
+    _tree(source, {"a.md": "\\alpha\n", "b/c.md": "x^2\n", "d.txt": "\\beta"})
+    summary = batch.convert_tree(str(source), str(target), "expr", jobs=1)
+    assert summary[batch.CONVERTED][0] == 2
+    assert (target / "a.md").read_text(encoding="utf-8") == "α\n"
+    assert (target / "b" / "c.md").read_text(encoding="utf-8") == "x²\n"
+    assert not (target / "d.txt").exists()
+    summary = batch.convert_tree(str(source), str(target), "expr", jobs=1)
+    assert summary[batch.UNCHANGED][0] == 2
+
+def test_failed_file_does_not_stop_the_tree(tmp_path, monkeypatch):
+    source = tmp_path / "docs"
+    target = tmp_path / "out"
+    _tree(source, {"a.md": "\\alpha\n", "b.md": "boom\n", "c.md": "x^2\n"})
+    convert_file = batch.stream.convert_file
+
+    def failing(source_file, file, mode, **kwargs):
+        if source_file.name.endswith("b.md"):
+            raise KeyError("boom")
+        return convert_file(source_file, file, mode, **kwargs)
+
+    monkeypatch.setattr(batch.stream, "convert_file", failing)
+    messages = []
+    summary = batch.convert_tree(
+        str(source), str(target), "expr", jobs=1, log=messages.append)
+    assert summary[batch.CONVERTED][0] == 2
+    assert summary[batch.FAILED][0] == 1
+    assert len(messages) == 1 and "KeyError" in messages[0]
+    assert not (target / "b.md").exists()
+    assert (target / "c.md").read_text(encoding="utf-8") == "x²\n"
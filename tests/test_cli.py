@@ -0,0 +1,66 @@
+"""Command line interface (`Warp.cli`)."""
+
+import io
+
+import pytest
+
+from Warp import cli
+from Warp import engine
+from Warp.cli import stream
+
+# Commands, groups, multibyte characters (2 to 4 bytes in UTF-8) and
+# fences, which straddle chunk boundaries for small chunks
+DOCUMENT = (
+    "\\alpha_i^{2} \\mathbb{R} é\\frac{1}{2} 𝔸 \\hat{x}\n"
+    "```\n\\t x^2\n```\n"
+    "a `\\d` $\\beta$ \\_ \\mathfrak{Hello} \\sum_{n=1}^{N}\n")
+
+def test_convert_file(tmp_path):
+    source = tmp_path / "doc.md"
+    source.write_text("\\alpha_i `\\t`\n", encoding="utf-8")
+    target = tmp_path / "out.md"
+    assert cli.main([str(source), "-o", str(target)]) == 0
+    assert target.read_text(encoding="utf-8") == "αᵢ `\\t`\n"
+
+def test_same_input_and_output_is_rejected(tmp_path):
+    source = tmp_path / "doc.md"
+    source.write_text("\\alpha\n", encoding="utf-8")
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main([str(source), "-o", str(source)])
+    assert exc_info.value.code == 2
+    assert source.read_text(encoding="utf-8") == "\\alpha\n"
+
+def test_same_input_and_output_directory_is_rejected(tmp_path):
+    source = tmp_path / "docs"
+    source.mkdir()
+    (source / "doc.md").write_text("\\alpha\n", encoding="utf-8")
+    for output in [source, f"{tmp_path}/./docs/"]:
+        with pytest.raises(SystemExit) as exc_info:
+            cli.main([str(source), "-o", str(output)])
+        assert exc_info.value.code == 2
+    assert (source / "doc.md").read_text(encoding="utf-8") == "\\alpha\n"
+    assert not (source / ".warp-cache.json").exists()
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7])
+@pytest.mark.parametrize("markup", [None, "markdown"])
+def test_chunks_equal_whole_conversion(tmp_path, chunk_size, markup):
+    expected = engine.convert(DOCUMENT, "expr", markup)
+    # Memory-mapped file and pipe-like file
+    path = tmp_path / "doc.md"
+    path.write_text(DOCUMENT, encoding="utf-8")
+    sources = [open(path, "rb"), io.BytesIO(DOCUMENT.encode("utf-8"))]
+    for source in sources:
+        target = io.BytesIO()
+        with source:
+            nbytes = stream.convert_file(
+                source, target, "expr", chunk_size, markup)
+        assert nbytes == len(DOCUMENT.encode("utf-8"))
+        assert target.getvalue().decode("utf-8") == expected
+
+def test_chunk_size_option(tmp_path):
+    source = tmp_path / "doc.md"
+    source.write_text(DOCUMENT, encoding="utf-8")
+    target = tmp_path / "out.md"
+    assert cli.main([str(source), "-o", str(target), "--chunk-size", "3"]) == 0
+    assert target.read_text(encoding="utf-8") == engine.convert(
+        DOCUMENT, "expr", "markdown")
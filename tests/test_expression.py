@@ -0,0 +1,27 @@
+"""Inline expressions (`engine.expression`)."""
+
+import pytest
+
+from Warp import engine
+from Warp.engine import expression
+
+def test_expression():
+    assert engine.convert(
+        "x^{2} a_{i,j} \\frac{1}{2} \\mathbb{R}^{n}", "expr") == (
+        "x² a_(i,j) ½ ℝⁿ")
+
+@pytest.mark.parametrize("text", [
+    "^{" * 200,
+    "_{" * 5000,
+    "^{x" * 300 + "}" * 300,
+    "\\mathbb{" * 3000,
+    "\\frac{" * 3000,
+    "^\\mathbb{" * 2000,
+    "{" * 5000])
+def test_deep_nesting_is_bounded(text):
+    output = engine.convert(text, "expr")
+    assert "".join(engine.stream([text], "expr")) == output
+
+def test_script_too_deep_is_left_as_typed():
+    text = "^{" * (expression.MAX_DEPTH + 10)
+    assert "^{" * 5 in engine.convert(text, "expr")
@@ -0,0 +1,80 @@
+"""Cancellation of incremental conversions (`cat.incremental`)."""
+
+from Warp.cat import base as cat_base
+from Warp.cat import incremental
+from Warp.engine import base
+
+TEXT = "x^2+\\beta_1 " * 20000
+
+def _tokenize(key, user_input, start):
+    return base.tokens(user_input, start, key)
+
+def _converter():
+    return incremental.Converter(_tokenize, lookbehind=base.LOOKAHEAD)
+
+class Terminator:
+    """`should_terminate` stub answering `True` after `checks` calls."""
+
+    def __init__(self, checks):
+        self.checks = checks
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.calls > self.checks
+
+def test_abort_returns_none_after_bounded_work():
+    tokens = []
+
+    def counting(key, user_input, start):
+        for token in _tokenize(key, user_input, start):
+            tokens.append(token)
+            yield token
+
+    converter = incremental.Converter(counting, lookbehind=base.LOOKAHEAD)
+    terminate = Terminator(0)
+    assert converter.convert("^", TEXT, terminate) is None
+    assert terminate.calls == 1
+    # Wasted work is at most a chunk of tokens, whatever the input size
+    assert len(tokens) <= incremental.Converter.CHUNK_SIZE
+    assert tokens[-1][0] < len(TEXT) // 100
+
+def test_resumed_conversion_equals_full_conversion():
+    converter = _converter()
+    expected = base.construct_output(TEXT, "^")
+    for checks in [0, 1, 3]:
+        assert converter.convert("^", TEXT, Terminator(checks)) is None
+    assert converter.convert("^", TEXT) == expected
+
+def test_resumed_after_abort_converts_only_the_rest():
+    converter = _converter()
+    converter.convert("^", TEXT, Terminator(2))
+    done = len(converter._ends)
+    calls = []
+
+    def counting(key, user_input, start):
+        calls.append(start)
+        return _tokenize(key, user_input, start)
+
+    converter._tokenize = counting
+    assert converter.convert("^", TEXT) == base.construct_output(TEXT, "^")
+    assert calls and calls[0] > 0
+    assert len(converter._ends) > done
+
+def test_typing_reuses_previous_conversion():
+    converter = _converter()
+    for end in range(1, 40):
+        text = TEXT[:end]
+        assert converter.convert("_", text) == base.construct_output(text, "_")
+
+def test_other_key_is_converted_from_scratch():
+    converter = _converter()
+    converter.convert("^", "12")
+    assert converter.convert("_", "12") == base.construct_output("12", "_")
+
+def test_suggestions_are_empty_when_superseded(plugin):
+    plugin.should_terminate = Terminator(0)
+    assert cat_base.get_suggestions(plugin, TEXT, "^") == []
+    plugin.should_terminate = lambda: False
+    [item] = cat_base.get_suggestions(plugin, TEXT, "^")
+    assert item.target() == base.construct_output(TEXT, "^")
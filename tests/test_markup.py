@@ -0,0 +1,98 @@
+"""Markup-aware lexing of documents (`engine.markup`)."""
+
+import time
+
+from Warp.engine import markup
+
+def _unclosed_runs(size, char):
+    """Returns a line of `size` characters with runs of `char` of distinct
+    lengths, none of them closed."""
+
+    parts = []
+    length = 0
+    while sum(map(len, parts)) < size:
+        length += 1
+        parts.append(char * length + " x ")
+    return "".join(parts) + "\n"
+
+def test_unclosed_runs_are_linear():
+    for syntax, char in [[markup.MARKDOWN, "`"], [markup.ASCIIDOC, "+"]]:
+        line = _unclosed_runs(320_000, char)
+        start = time.perf_counter()
+        assert markup.convert(line, syntax, str.upper) == line.upper()
+        assert time.perf_counter() - start < 0.5
+
+def _lex(text, syntax=markup.MARKDOWN, size=None):
+    """Returns the `[prose, region]` pairs of `text` fed in chunks of `size`
+    characters (whole if `None`), adjacent regions of a kind merged."""
+
+    lexer = markup.Lexer(syntax)
+    size = size or max(len(text), 1)
+    pairs = []
+    for start in range(0, len(text), size):
+        pairs.extend(lexer.feed(text[start:start+size]))
+    pairs.extend(lexer.close())
+    regions = []
+    for prose, region in pairs:
+        if regions and regions[-1][0] == prose:
+            regions[-1][1] += region
+        else:
+            regions.append([prose, region])
+    return regions
+
+def _verbatim(text, syntax=markup.MARKDOWN):
+    """Returns the regions of `text` that aren't converted."""
+
+    return [region for prose, region in _lex(text, syntax) if not prose]
+
+def test_fenced_code():
+    text = "a\n```py\n\\t x\n```\nb\n~~~~\n\\d\n~~~~\n"
+    assert _verbatim(text) == ["```py\n\\t x\n```\n", "~~~~\n\\d\n~~~~\n"]
+    # A shorter fence doesn't close the block
+    assert _verbatim("````\nx\n```\ny\n") == ["````\nx\n```\ny\n"]
+
+def test_indented_code():
+    # Fences may be indented by up to three spaces
+    assert _verbatim("   ```\n\\t\n   ```\nb\n") == ["   ```\n\\t\n   ```\n"]
+    # Indented code blocks aren't recognized (see `markup`)
+    assert _verbatim("    ```\n\\t\n") == []
+
+def test_code_spans_with_mismatched_runs():
+    assert _verbatim("a ``x` y`` z\n") == ["``x` y``"]
+    assert _verbatim("a `x`` y\n") == []
+    assert _verbatim("``a` `` `b`\n") == ["``a` ``", "`b`"]
+    # Spans end on their line
+    assert _verbatim("`a\nb`\n") == []
+
+def test_math():
+    text = "a $x$ b $$y$$ c $ 5 $d\n"
+    assert _verbatim(text) == ["$x$", "$$y$$"]
+    assert _verbatim("$$\n\\hat x\n$$\nb\n") == ["$$\n\\hat x\n$$\n"]
+    # Display math also ends with its paragraph
+    assert _verbatim("$$\nx\n\ny\n") == ["$$\nx\n\n"]
+
+def test_escapes():
+    assert _lex("\\_x\\t\\`y`\n") == [
+        [False, "\\_"], [True, "x\\t"], [False, "\\`"], [True, "y`\n"]]
+
+def test_asciidoc_blocks():
+    text = "----\n\\t\n----\nb\n....\n\\d\n....\n// c\n////\nx\n////\n"
+    assert _verbatim(text, markup.ASCIIDOC) == [
+        "----\n\\t\n----\n", "....\n\\d\n....\n// c\n////\nx\n////\n"]
+
+def test_asciidoc_macros_and_passthrough():
+    text = "a pass:[\\t] b +\\t+ c ++d+ e++ f stem:[x] `m` +g\n"
+    assert _verbatim(text, markup.ASCIIDOC) == [
+        "pass:[\\t]", "+\\t+", "++d+ e++", "stem:[x]", "`m`"]
+    assert _verbatim("latexmath:[a\\]b] c]\n", markup.ASCIIDOC) == [
+        "latexmath:[a\\]b]"]
+
+def test_chunks_split_delimiters():
+    documents = [
+        [markup.MARKDOWN,
+         "a\n```\n\\t\n```\nb ``c` d`` $e$ \\_ f\n$$\ng\n$$\n"],
+        [markup.ASCIIDOC, "a\n----\n\\t\n----\nb +c+ pass:[d] `e` ++f++\n"]]
+    for syntax, text in documents:
+        whole = _lex(text, syntax)
+        for size in [1, 2, 3, 7]:
+            assert _lex(text, syntax, size) == whole
@@ -0,0 +1,79 @@
+"""Exact output of suggestions (`cat.exact`, `cat.deferred`, `cat.render`)
+with characters beyond `U+FFFF`."""
+
+import pytest
+
+from Warp import cat
+from Warp.cat import diacritical as cat_diacritical
+from Warp.cat import fonts as cat_fonts
+from Warp.cat import symbols as cat_symbols
+from Warp.engine import diacritical
+from Warp.engine import fonts
+
+ASTRAL = ["𝔸", "𝟙", "𝔸𝔹ℂ", "x𝟙y", "𝒜 ≠ 𝟘"]
+
+@pytest.mark.parametrize("output", ASTRAL)
+def test_exact_round_trip(output):
+    data_bag = cat.exact(output)
+    assert data_bag.isascii()
+    assert cat.render(data_bag) == output
+
+@pytest.mark.parametrize("output", ["", "α", "ℝ²", "\uffff"])
+def test_exact_is_empty_for_bmp_output(output):
+    assert cat.exact(output) == ""
+
+def test_deferred_round_trip():
+    data_bag = cat.deferred(cat_fonts.__name__, "\\mathbb", "A1")
+    assert data_bag.isascii()
+    assert cat.render(data_bag) == "𝔸𝟙"
+
+def test_deferred_is_ascii_for_astral_input():
+    data_bag = cat.deferred(cat_fonts.__name__, "\\mathbb", "𝔸 x")
+    assert data_bag.isascii()
+    assert cat.render(data_bag) == fonts.construct_output("𝔸 x", "\\mathbb")[0]
+
+def test_font_suggestion_is_exact(plugin):
+    [item] = cat_fonts.get_suggestions(plugin, "A1", "\\mathbb")
+    assert item.data_bag().isascii()
+    assert cat.render(item.data_bag()) == "𝔸𝟙"
+    # Only the display is padded (see `cat.padded`)
+    assert item.short_desc() == "𝔸𝟙𝔸𝟙"
+
+def test_all_styles_are_exact(plugin):
+    items = cat_fonts.get_suggestions(plugin, "Ab1", fonts.KEYWORD_FONTS)
+    assert items
+    for item in items:
+        keyword = item.target().split(" ")[0]
+        assert item.data_bag().isascii()
+        assert cat.render(item.data_bag()) == fonts.construct_output(
+            "Ab1", keyword)[0]
+        assert item.short_desc().endswith(cat.padded(
+            cat.render(item.data_bag())))
+
+def test_astral_symbols_are_exact(plugin):
+    items = [
+        item for item in cat_symbols.assign_cat(plugin)
+        if max(item.target()) > "\uffff"]
+    assert items
+    for item in items:
+        assert item.data_bag().isascii()
+        assert cat.render(item.data_bag()) == item.target()
+
+@pytest.mark.parametrize("user_input", ["𝜑", "𝔸x", "x 𝟙"])
+def test_astral_diacritical_output_is_exact(plugin, user_input):
+    hat = diacritical.INDEX_DIACRITICAL["\\hat"]
+    [item] = cat_diacritical.get_suggestions(plugin, user_input, hat)
+    assert item.data_bag().isascii()
+    assert cat.render(item.data_bag()) == diacritical.construct_output(
+        user_input, hat)
+
+def test_padded():
+    assert cat.padded("𝔸1ℝ𝟙") == "𝔸1ℝ𝟙𝔸𝟙"
+    assert cat.padded("ℝ x") == "ℝ x"
+
+def test_font_descriptions_are_padded(plugin):
+    for item in cat_fonts.assign_cat(plugin):
+        name, sample = item.short_desc().split(": ")
+        astral = sum(char > "\uffff" for char in sample)
+        unpadded = sample[:len(sample) - astral // 2]
+        assert cat.padded(unpadded) == sample, name
@@ -0,0 +1,35 @@
+"""Search of entries by their commands (`engine.search`)."""
+
+import time
+
+from Warp import engine
+from Warp.engine import search
+
+ENTRIES = [
+    ["\\alpha", "α", "α"],
+    ["\\lambda", "λ", "λ"],
+    ["\\neq", "≠", "≠"],
+    ["\\mathbb", "mathbb", "blackboard bold"]]
+
+def test_ranking():
+    index = search.Index(ENTRIES)
+    assert index.search("\\alp") == ["α"]
+    assert index.search("lamda") == ["λ"]
+    assert index.search("not equal") == ["≠"]
+    assert index.search("blackboard") == ["mathbb"]
+
+def test_long_query_is_not_searched_for_typos():
+    index = search.Index(ENTRIES)
+    start = time.perf_counter()
+    for length in [400, 800]:
+        assert index.search("x" * length) == []
+    assert time.perf_counter() - start < 0.5
+
+def test_query_longer_by_max_distance_is_a_typo():
+    index = search.Index(ENTRIES)
+    assert index.search("lambdaxx") == ["λ"]
+
+def test_suggest_finds_symbols_by_tags():
+    assert engine.suggest("blackboard") == [["\\Bbbk", "𝕜"]]
+    assert engine.suggest("gradient")[0] == ["\\nabla", "∇"]
+    assert engine.suggest("\\alpha")[0] == ["\\alpha", "α"]
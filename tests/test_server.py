@@ -0,0 +1,88 @@
+"""Conversion server (`cli.server`)."""
+
+import io
+import json
+import sys
+
+import pytest
+
+from conftest import SRC
+from Warp.cli import server
+
+# Starts the server of `src` imported as `Warp` (see `conftest`)
+BOOT = f"""
+import sys, types
+package = types.ModuleType("Warp")
+package.__path__ = [{str(SRC)!r}]
+sys.modules["Warp"] = package
+from Warp import cli
+sys.exit(cli.main(["--serve"]))
+"""
+
+def _serve(*requests):
+    """Returns the answers of `serve_file` to `requests` (lines)."""
+
+    reader = io.BytesIO(b"".join(
+        (request if isinstance(request, bytes) else json.dumps(
+            request).encode("utf-8")) + b"\n" for request in requests))
+    writer = io.BytesIO()
+    server.serve_file(reader, writer)
+    return [json.loads(line) for line in writer.getvalue().splitlines()]
+
+def test_pipelined_requests_are_answered_in_order():
+    answers = _serve(
+        {"id": 1, "method": "convert", "params": {"text": "\\alpha^2"}},
+        {"id": 2, "method": "suggest", "params": {"query": "\\alpha"}},
+        {"id": 3, "method": "render",
+         "params": {"kind": "pmatrix", "args": [1, 2]}})
+    assert [answer["id"] for answer in answers] == [1, 2, 3]
+    assert answers[0]["result"] == "α²"
+    assert answers[1]["result"][0] == ["\\alpha", "α"]
+    assert answers[2]["result"] == "( x  x )"
+
+def test_failed_requests_are_answered():
+    answers = _serve(
+        {"id": 1, "method": "nope"},
+        {"id": 2, "method": "convert", "params": {"txt": "x"}},
+        {"id": 3, "method": "convert", "params": {"text": 1}},
+        {"id": 4, "method": "convert",
+         "params": {"text": "4000", "mode": "RN"}},
+        {"id": 5, "method": "render",
+         "params": {"kind": "pmatrix", "args": [1, 2, 3, 4]}},
+        b"[" * 100000,
+        b"not json",
+        {"id": 6, "method": "convert", "params": {"text": "^{" * 200}},
+        {"id": 7, "method": "convert", "params": {"text": "\\beta"}})
+    assert len(answers) == 9
+    assert all("error" in answer for answer in answers[:7])
+    assert "Unknown method" in answers[0]["error"]
+    assert "Invalid params" in answers[1]["error"]
+    assert "Invalid params" not in answers[3]["error"]
+    assert "Invalid args" in answers[4]["error"]
+    assert answers[7]["id"] == 6 and "result" in answers[7]
+    assert answers[8] == {"id": 7, "result": "β"}
+
+def test_roman_numbers_are_limited():
+    answers = _serve(*[
+        {"id": number, "method": "convert",
+         "params": {"text": number, "mode": "\\RN"}}
+        for number in ["3999", "1000000", "9" * 12, "9" * 6000]])
+    assert answers[0]["result"] == "ⅯⅯⅯⅭⅯⅩⅭⅠⅩ"
+    assert answers[1]["result"] == "Ⅿ" * 1000
+    for answer in answers[2:]:
+        assert "Number of digits exceeds the limit" in answer["error"]
+
+def test_lone_surrogates_are_escaped():
+    [answer] = _serve(b'{"method": "convert", "params": {"text": "\\ud800"}}')
+    assert answer["result"] == "\ud800"
+
+def test_client():
+    with server.Client(command=[sys.executable, "-c", BOOT]) as client:
+        assert client.call("convert", text="\\mathbb{R}") == "ℝ"
+        ids = [client.send("convert", text=text) for text in ["x^2", "x_2"]]
+        answers = [client.receive(), client.receive()]
+        assert [answer["id"] for answer in answers] == ids
+        assert [answer["result"] for answer in answers] == ["x²", "x₂"]
+        with pytest.raises(ValueError, match="nope"):
+            client.call("convert", text="x", mode="nope")
+        assert client.call("convert", text="\\beta") == "β"
@@ -0,0 +1,42 @@
+"""Reverse conversion (`engine.unwarp`)."""
+
+import random
+
+from Warp import engine
+from Warp.engine import symbols
+
+def test_unwarp():
+    assert engine.convert("αᵢ⁽²⁾ ∈ ℝ", "unwarp") == (
+        "\\alpha_{i}^{(2)} \\in \\mathbb{R}")
+
+def test_padded_alias_is_not_preferred():
+    assert engine.convert("⊴", "unwarp") == "\\trianglelefteq"
+
+def test_marks():
+    cases = {
+        "x̂": "\\hat{x}",
+        "ab̂": "a\\hat{b}",
+        # A symbol is marked as a whole, and so is a marked symbol
+        "α̂": "\\hat{\\alpha}",
+        "x̂̃": "\\tilde{\\hat{x}}",
+        # Nothing precedes the mark, it is left unchanged
+        "̂x": "̂x",
+        "̂": "̂"}
+    for text, source in cases.items():
+        assert engine.convert(text, "unwarp") == source, text
+        assert engine.convert(source, "expr") == text, text
+
+def test_symbols_round_trip():
+    for command in symbols.INDEX_SYMBOLS:
+        output = engine.convert(command, "expr")
+        source = engine.convert(output, "unwarp")
+        assert engine.convert(source, "expr") == output, command
+
+def test_expressions_round_trip():
+    commands = list(symbols.INDEX_SYMBOLS)
+    rng = random.Random(0)
+    for _ in range(2000):
+        text = " ".join(rng.choice(commands) for _ in range(3)) + " x^{2}"
+        output = engine.convert(text, "expr")
+        source = engine.convert(output, "unwarp")
+        assert engine.convert(source, "expr") == output, text